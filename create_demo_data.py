@@ -16,7 +16,17 @@ import json
 import os
 import sqlite3
 import struct
-from datetime import datetime
+from datetime import datetime, timezone
+
+import numpy as np
+
+# Encoded form of an empty JSON object, shared by the campaign records
+EMPTY_JSON = "{}"
+
+_WKB_POINT = struct.Struct("<BIdd")
+
+# Packed (unaligned) layout of a little-endian 2D WKB Point, 21 bytes.
+_WKB_POINT_DTYPE = np.dtype([("byte_order", "<u1"), ("geom_type", "<u4"), ("x", "<f8"), ("y", "<f8")])
 
 
 def wkb_point(x: float, y: float) -> bytes:
@@ -32,7 +42,52 @@ def wkb_point(x: float, y: float) -> bytes:
     :param y: Y coordinate
     :returns: Binary blob suitable for insertion into the ``geom`` column.
     """
-    return struct.pack("<BIdd", 1, 1, float(x), float(y))
+    return _WKB_POINT.pack(1, 1, float(x), float(y))
+
+
+def wkb_points(xs, ys) -> list:
+    """Return little‑endian WKB Point blobs for many coordinates at once.
+
+    Equivalent to ``[wkb_point(x, y) for x, y in zip(xs, ys)]`` but
+    encodes the whole column in a single NumPy buffer which is then
+    sliced into one blob per point.
+
+    :param xs: Sequence of X coordinates.
+    :param ys: Sequence of Y coordinates (same length as ``xs``).
+    :returns: List of binary blobs suitable for the ``geom`` column.
+    """
+    arr = np.empty(len(xs), dtype=_WKB_POINT_DTYPE)
+    arr["byte_order"] = 1
+    arr["geom_type"] = 1
+    arr["x"] = xs
+    arr["y"] = ys
+    buf = arr.tobytes()
+    size = _WKB_POINT_DTYPE.itemsize
+    return [buf[i:i + size] for i in range(0, len(buf), size)]
+
+
+# Host parameters per statement; SQLite releases before 3.32 cap this at 999
+_MAX_SQL_PARAMS = 999
+
+
+def insert_rows(cur: sqlite3.Cursor, table: str, columns, rows) -> None:
+    """Insert rows into a table using multi-row ``VALUES`` statements.
+
+    Rows are grouped so that each ``INSERT`` binds at most
+    ``_MAX_SQL_PARAMS`` parameters, which means a whole demo table is
+    usually parsed and executed as a single statement.
+
+    :param cur: Cursor on the target database.
+    :param table: Name of the table to insert into.
+    :param columns: Column names, in the order of the values in each row.
+    :param rows: Sequence of tuples of column values.
+    """
+    row_sql = "(" + ", ".join("?" * len(columns)) + ")"
+    head = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+    batch = max(1, _MAX_SQL_PARAMS // len(columns))
+    for start in range(0, len(rows), batch):
+        chunk = rows[start:start + batch]
+        cur.execute(head + ", ".join([row_sql] * len(chunk)), [value for row in chunk for value in row])
 
 
 def main() -> None:
@@ -55,9 +110,43 @@ def main() -> None:
     # Initialise database
     conn = sqlite3.connect(db_path)
     cur = conn.cursor()
+    # Bulk-load tuning: WAL avoids the rollback journal (and lets the
+    # notebooks read while the script writes), NORMAL sync drops the
+    # fsync on every commit, and temp data/cache stay in memory.
+    if db_path != ":memory:":
+        cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.execute("PRAGMA cache_size=-65536")
     cur.executescript(ddl)
 
+    # Populate all tables inside one explicit transaction so the inserts
+    # below share a single commit instead of one per statement.
+    cur.execute("BEGIN IMMEDIATE")
+
+    # Drop the secondary indexes for the duration of the bulk load and
+    # rebuild each one in a single pass once the rows are in place.
+    # Automatic (primary key / unique) indexes cannot be dropped and
+    # have no stored SQL, so they are left alone.
+    secondary_indexes = cur.execute(
+        "SELECT name, sql FROM sqlite_master"
+        " WHERE type = 'index' AND name NOT LIKE 'sqlite_%' AND sql IS NOT NULL"
+    ).fetchall()
+    for name, _ in secondary_indexes:
+        cur.execute(f'DROP INDEX "{name}"')
+
     # Insert campaigns
+    uls_semantic_json = json.dumps({"1": "ground", "2": "wood", "3": "leaf"})
+    uls_dims_json = json.dumps(
+        {
+            "instance_in": "instance_pred",
+            "semantic_in": "semantic_pred",
+            "score_in": "score",
+            "instance_std": "ST_INSTANCE",
+            "semantic_std": "ST_SEMANTIC",
+            "score_std": "ST_SCORE",
+        }
+    )
     campaigns = [
         {
             "campaign_uid": "CAM_FI_2025-01-01_AREA1",
@@ -65,8 +154,8 @@ def main() -> None:
             "acquisition_date": "2025-01-01",
             "area_uid": "Area1",
             "crs_epsg": 3035,
-            "semantic_codebook_json": json.dumps({}),
-            "dims_json": json.dumps({}),
+            "semantic_codebook_json": EMPTY_JSON,
+            "dims_json": EMPTY_JSON,
             "footprint_geom": None,
             "notes": "Field inventory campaign",
         },
@@ -76,15 +165,8 @@ def main() -> None:
             "acquisition_date": "2025-01-02",
             "area_uid": "Area1",
             "crs_epsg": 3035,
-            "semantic_codebook_json": json.dumps({"1": "ground", "2": "wood", "3": "leaf"}),
-            "dims_json": json.dumps({
-                "instance_in": "instance_pred",
-                "semantic_in": "semantic_pred",
-                "score_in": "score",
-                "instance_std": "ST_INSTANCE",
-                "semantic_std": "ST_SEMANTIC",
-                "score_std": "ST_SCORE",
-            }),
+            "semantic_codebook_json": uls_semantic_json,
+            "dims_json": uls_dims_json,
             "footprint_geom": None,
             "notes": "Uncrewed laser scanning (drone) campaign",
         },
@@ -94,8 +176,8 @@ def main() -> None:
             "acquisition_date": "2025-01-03",
             "area_uid": "Area1",
             "crs_epsg": None,
-            "semantic_codebook_json": json.dumps({}),
-            "dims_json": json.dumps({}),
+            "semantic_codebook_json": EMPTY_JSON,
+            "dims_json": EMPTY_JSON,
             "footprint_geom": None,
             "notes": "Harvester production file",
         },
@@ -105,31 +187,28 @@ def main() -> None:
             "acquisition_date": "2025-01-05",
             "area_uid": "Area1",
             "crs_epsg": None,
-            "semantic_codebook_json": json.dumps({}),
-            "dims_json": json.dumps({}),
+            "semantic_codebook_json": EMPTY_JSON,
+            "dims_json": EMPTY_JSON,
             "footprint_geom": None,
             "notes": "CT scanning at sawmill",
         },
     ]
-    for camp in campaigns:
-        cur.execute(
-            "INSERT INTO campaigns (campaign_uid, source_uid, acquisition_date, area_uid, crs_epsg,"
-            " semantic_codebook_json, dims_json, footprint_geom, notes)"
-            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            (
-                camp["campaign_uid"],
-                camp["source_uid"],
-                camp["acquisition_date"],
-                camp["area_uid"],
-                camp["crs_epsg"],
-                camp["semantic_codebook_json"],
-                camp["dims_json"],
-                camp["footprint_geom"],
-                camp["notes"],
-            ),
-        )
+    campaign_columns = (
+        "campaign_uid",
+        "source_uid",
+        "acquisition_date",
+        "area_uid",
+        "crs_epsg",
+        "semantic_codebook_json",
+        "dims_json",
+        "footprint_geom",
+        "notes",
+    )
+    insert_rows(cur, "campaigns", campaign_columns, [tuple(c[k] for k in campaign_columns) for c in campaigns])
 
     # Define some tree positions and attributes
+    tree_positions = [("T001", (0.0, 0.0)), ("T002", (10.0, 0.0)), ("T003", (0.0, 10.0)), ("T004", (10.0, 10.0))]
+    tree_geoms = wkb_points([x for _, (x, _) in tree_positions], [y for _, (_, y) in tree_positions])
     tree_specs = [
         (
             "T001",
@@ -142,7 +221,7 @@ def main() -> None:
             6.0,
             "2025-01-02",
             3035,
-            wkb_point(0.0, 0.0),
+            tree_geoms[0],
             0,
         ),
         (
@@ -156,7 +235,7 @@ def main() -> None:
             5.0,
             "2025-01-02",
             3035,
-            wkb_point(10.0, 0.0),
+            tree_geoms[1],
             0,
         ),
         (
@@ -170,7 +249,7 @@ def main() -> None:
             5.5,
             "2025-01-05",
             3035,
-            wkb_point(0.0, 10.0),
+            tree_geoms[2],
             0,
         ),
         (
@@ -184,14 +263,27 @@ def main() -> None:
             6.2,
             "2025-01-05",
             3035,
-            wkb_point(10.0, 10.0),
+            tree_geoms[3],
             0,
         ),
     ]
-    cur.executemany(
-        "INSERT INTO trees (tree_uid, treeID, source, species_code, status, height_m, dbh_cm,"
-        " crown_base_height_m, last_measurement_date, crs_epsg, geom, is_temporary)"
-        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+    insert_rows(
+        cur,
+        "trees",
+        (
+            "tree_uid",
+            "treeID",
+            "source",
+            "species_code",
+            "status",
+            "height_m",
+            "dbh_cm",
+            "crown_base_height_m",
+            "last_measurement_date",
+            "crs_epsg",
+            "geom",
+            "is_temporary",
+        ),
         tree_specs,
     )
 
@@ -263,14 +355,29 @@ def main() -> None:
         }
     )
     # Insert measurements
-    cur.executemany(
-        "INSERT INTO measurements (measurement_uid, tree_uid, campaign_uid, source_type,"
-        " measurement_date, height_m, dbh_cm, crown_base_height_m, species_code, age, health,"
-        " machine_id, stand_id, notes, match_status, candidate_tree_uid)"
-        " VALUES (:measurement_uid, :tree_uid, :campaign_uid, :source_type, :measurement_date,"
-        " :height_m, :dbh_cm, :crown_base_height_m, :species_code, :age, :health, :machine_id,"
-        " :stand_id, :notes, :match_status, :candidate_tree_uid)",
-        measurements,
+    measurement_columns = (
+        "measurement_uid",
+        "tree_uid",
+        "campaign_uid",
+        "source_type",
+        "measurement_date",
+        "height_m",
+        "dbh_cm",
+        "crown_base_height_m",
+        "species_code",
+        "age",
+        "health",
+        "machine_id",
+        "stand_id",
+        "notes",
+        "match_status",
+        "candidate_tree_uid",
+    )
+    insert_rows(
+        cur,
+        "measurements",
+        measurement_columns,
+        [tuple(m[c] for c in measurement_columns) for m in measurements],
     )
 
     # Insert nested tables: whorls for field measurement of T001 and T002
@@ -281,8 +388,10 @@ def main() -> None:
         {"measurement_uid": "T002_field_2025-01-01", "whorl_id": "W2", "height_from_base": 3.5},
     ]
     # Table names in the GeoPackage schema are lower‑case (whorls), so use the correct case
-    cur.executemany(
-        "INSERT INTO whorls (measurement_uid, whorl_id, height_from_base_m) VALUES (?, ?, ?)",
+    insert_rows(
+        cur,
+        "whorls",
+        ("measurement_uid", "whorl_id", "height_from_base_m"),
         [(r["measurement_uid"], r["whorl_id"], r["height_from_base"]) for r in whorls],
     )
 
@@ -299,32 +408,53 @@ def main() -> None:
         }
     ]
     # Table names in the GeoPackage schema are lower‑case (ct_metrics), so use the correct case
-    cur.executemany(
-        "INSERT INTO ct_metrics (measurement_uid, metric_id, knot_count, max_knot_diameter_cm,"
-        " mean_ring_width_mm, density_kg_m3, description)"
-        " VALUES (:measurement_uid, :metric_id, :knot_count, :max_knot_diameter_cm,"
-        " :mean_ring_width_mm, :density_kg_m3, :description)",
-        ct_metrics,
+    ct_metric_columns = (
+        "measurement_uid",
+        "metric_id",
+        "knot_count",
+        "max_knot_diameter_cm",
+        "mean_ring_width_mm",
+        "density_kg_m3",
+        "description",
+    )
+    insert_rows(
+        cur,
+        "ct_metrics",
+        ct_metric_columns,
+        [tuple(r[c] for c in ct_metric_columns) for r in ct_metrics],
     )
 
     # Create simple point cloud CSVs
-    # Tree pack: a few points around each tree (x,y,z)
+    # Tree pack: a few points around each tree (x,y,z).  File sizes are
+    # taken from the final write position rather than a separate stat().
     tree_pack_path = os.path.join(pc_dir, "tree_pack_tile1.csv")
-    with open(tree_pack_path, "w", encoding="utf-8") as f:
-        f.write("x,y,z,tree_uid\n")
-        for uid, (x, y) in [("T001", (0.0, 0.0)), ("T002", (10.0, 0.0)), ("T003", (0.0, 10.0)), ("T004", (10.0, 10.0))]:
-            for i in range(5):
-                f.write(f"{x + 0.2 * i},{y + 0.2 * i},{1.0 + i}," + uid + "\n")
+    steps = np.arange(5, dtype=np.float64)
+    tree_xy = np.array([xy for _, xy in tree_positions], dtype=np.float64)
+    tree_pack = np.empty(
+        len(tree_positions) * steps.size,
+        dtype=[("x", "<f8"), ("y", "<f8"), ("z", "<f8"), ("tree_uid", "U16")],
+    )
+    tree_pack["x"] = (tree_xy[:, 0:1] + 0.2 * steps).ravel()
+    tree_pack["y"] = (tree_xy[:, 1:2] + 0.2 * steps).ravel()
+    tree_pack["z"] = np.tile(1.0 + steps, len(tree_positions))
+    tree_pack["tree_uid"] = np.repeat([uid for uid, _ in tree_positions], steps.size)
+    with open(tree_pack_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        np.savetxt(
+            f, tree_pack, fmt=["%.1f", "%.1f", "%.1f", "%s"], delimiter=",", header="x,y,z,tree_uid", comments=""
+        )
+        tree_pack_bytes = f.tell()
 
     # Ground-only: grid of ground points
     ground_path = os.path.join(pc_dir, "ground_only_tile1.csv")
-    with open(ground_path, "w", encoding="utf-8") as f:
-        f.write("x,y,z\n")
-        for x in range(-1, 12, 2):
-            for y in range(-1, 12, 2):
-                f.write(f"{float(x)},{float(y)},0.0\n")
+    grid = np.arange(-1, 12, 2, dtype=np.float64)
+    gx, gy = np.meshgrid(grid, grid, indexing="ij")
+    ground = np.column_stack([gx.ravel(), gy.ravel(), np.zeros(gx.size)])
+    with open(ground_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        np.savetxt(f, ground, fmt="%.1f", delimiter=",", header="x,y,z", comments="")
+        ground_bytes = f.tell()
 
-    # Register assets for the ULS campaign
+    # Register assets for the ULS campaign; both share one ingestion timestamp
+    now_iso = datetime.now(timezone.utc).isoformat()
     assets = [
         {
             "asset_uid": "pc_CAM_ULS_2025-01-02_AREA1_tile1_tree_pack",
@@ -337,9 +467,9 @@ def main() -> None:
             "uri": os.path.relpath(tree_pack_path, notebooks_dir),
             "crs_epsg": 3035,
             "point_count": 20,  # 4 trees * 5 points each
-            "bytes": os.path.getsize(tree_pack_path),
+            "bytes": tree_pack_bytes,
             "hash": None,
-            "created_at": datetime.utcnow().isoformat(),
+            "created_at": now_iso,
             "notes": "Demo tree pack CSV",
         },
         {
@@ -353,22 +483,39 @@ def main() -> None:
             "uri": os.path.relpath(ground_path, notebooks_dir),
             "crs_epsg": 3035,
             "point_count": 36,  # grid 6x6
-            "bytes": os.path.getsize(ground_path),
+            "bytes": ground_bytes,
             "hash": None,
-            "created_at": datetime.utcnow().isoformat(),
+            "created_at": now_iso,
             "notes": "Demo ground points CSV",
         },
     ]
-    cur.executemany(
-        "INSERT INTO assets (asset_uid, campaign_uid, tree_uid, scope, pc_role, asset_type, format, uri,"
-        " crs_epsg, point_count, bytes, hash, created_at, notes)"
-        " VALUES (:asset_uid, :campaign_uid, :tree_uid, :scope, :pc_role, :asset_type, :format, :uri,"
-        " :crs_epsg, :point_count, :bytes, :hash, :created_at, :notes)",
-        assets,
+    asset_columns = (
+        "asset_uid",
+        "campaign_uid",
+        "tree_uid",
+        "scope",
+        "pc_role",
+        "asset_type",
+        "format",
+        "uri",
+        "crs_epsg",
+        "point_count",
+        "bytes",
+        "hash",
+        "created_at",
+        "notes",
     )
+    insert_rows(cur, "assets", asset_columns, [tuple(a[c] for c in asset_columns) for a in assets])
 
-    # Commit and close
+    # Rebuild the secondary indexes dropped before the bulk load
+    for _, sql in secondary_indexes:
+        cur.execute(sql)
     conn.commit()
+
+    # Switch back to a rollback journal so the shipped database is a
+    # single self-contained file without -wal/-shm sidecars
+    if db_path != ":memory:":
+        cur.execute("PRAGMA journal_mode=DELETE")
     conn.close()
     print(f"Demo database created at {db_path}")
     print(f"Tree pack CSV: {tree_pack_path}")
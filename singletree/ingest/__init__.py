@@ -10,10 +10,19 @@ Additional modules (e.g. for harvester production files, field
 inventories, or sawmill data) may be added as the project evolves.
 """
 
-from . import lidar  # noqa: F401
-from . import harvester_hpr  # noqa: F401
+import importlib
 
 __all__ = [
     "lidar",
     "harvester_hpr",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Submodules are imported on first access (PEP 562) so that importing
+    # the package does not pull in their heavy dependencies up front.
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
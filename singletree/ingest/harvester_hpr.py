@@ -3,11 +3,13 @@
 This module provides functions to ingest harvester production files
 written in the StanForD 2010 XML format (typically with a ``.hpr``
 extension).  It relies on the Python port of the *optBuck* library
-provided by the user to parse the XML into pandas data frames.  The
-ingestor converts these data frames into plain Python dictionaries
-that match the tables defined in the SingleTree specification.  It
-also records the raw HPR file as an asset so that the original data
-can be retained for provenance and reprocessing.
+provided by the user to parse the XML into pandas data frames, or on
+a streaming parser (faster with ``lxml``) when optbuck is not
+installed or ``fast=True`` is passed.  The ingestor converts these
+data frames into plain Python dictionaries that match the tables
+defined in the SingleTree specification.  It also records the raw HPR
+file as an asset so that the original data can be retained for
+provenance and reprocessing.
 
 The primary entry point is :func:`import_harvester_hpr`, which
 returns a dictionary containing the asset metadata and lists of
@@ -38,8 +40,20 @@ from __future__ import annotations
 
 import os
 import uuid
+import bisect
 import datetime
+import hashlib
+import mmap
+import shutil
 from typing import Dict, List, Optional
+from xml.etree import ElementTree
+
+try:
+    # lxml is optional; it speeds up :func:`_fast_parse_hpr` and lets
+    # it discard processed stems early.
+    from lxml import etree  # type: ignore
+except ImportError:  # pragma: no cover - handled at runtime
+    etree = None  # type: ignore
 
 try:
     # Attempt to import the optbuck library.  This module is
@@ -52,13 +66,20 @@ try:
 except ImportError:  # pragma: no cover - handled at runtime
     optbuck = None  # type: ignore
 
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # pragma: no cover - handled at runtime
+    np = None  # type: ignore
+    pd = None  # type: ignore
+
 
 def _ensure_optbuck() -> None:
     """Ensure that the optbuck library is available.
 
     This helper raises an ImportError with a helpful message if
-    ``optbuck`` could not be imported.  It is called at the start
-    of each ingestion function.
+    ``optbuck`` could not be imported.  It is called before each
+    optbuck-based parse.
     """
 
     if optbuck is None:
@@ -74,35 +95,63 @@ def _make_asset_uid() -> str:
     return str(uuid.uuid4())
 
 
+# Block size for hashing files that cannot be memory-mapped
+_HASH_BLOCK_SIZE = 256 * 1024
+
+
 def _file_metadata(path: str) -> Dict[str, object]:
     """Gather basic file metadata for a given path.
 
+    The checksum is computed by :func:`hashlib.file_digest` (Python
+    3.11+), which streams the file through OpenSSL in C.  Older
+    interpreters memory-map the file and hash it in a single call,
+    falling back to reading it in blocks if it cannot be mapped.
+
     :param path: Path to a file on disk.
     :returns: Dictionary with size in bytes and SHA256 checksum.
     """
-    import hashlib
-
-    buf_size = 65536
-    sha256 = hashlib.sha256()
-    size = 0
     with open(path, "rb") as f:
-        while True:
-            data = f.read(buf_size)
-            if not data:
-                break
-            size += len(data)
-            sha256.update(data)
+        if hasattr(hashlib, "file_digest"):
+            sha256 = hashlib.file_digest(f, "sha256")
+            return {"bytes": f.tell(), "hash": sha256.hexdigest()}
+        size = os.fstat(f.fileno()).st_size
+        sha256 = hashlib.sha256()
+        if size:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    sha256.update(mm)
+            except (OSError, ValueError):
+                # Some file systems (e.g. network mounts) cannot be mapped
+                sha256 = hashlib.sha256()
+                f.seek(0)
+                for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+                    sha256.update(block)
     return {"bytes": size, "hash": sha256.hexdigest()}
 
 
+def _copy_and_hash(src_path: str, dst_path: str) -> Dict[str, object]:
+    """Copy a file and gather the metadata of the copy.
+
+    The copy is made with :func:`shutil.copyfile`, which on Linux uses
+    the in-kernel ``copy_file_range``/``sendfile`` paths so that the
+    data never passes through user-space buffers.  The fresh copy is
+    then hashed while it is still in the page cache.
+
+    :param src_path: File to copy.
+    :param dst_path: Destination path (overwritten if it exists).
+    :returns: Dictionary with size in bytes and SHA256 checksum, as
+        returned by :func:`_file_metadata`.
+    """
+    shutil.copyfile(src_path, dst_path)
+    return _file_metadata(dst_path)
+
+
 def _normalize_date(date_str: Optional[str]) -> Optional[str]:
-    """Normalize date strings from the harvester file.
+    """Normalize a single date string from the harvester file.
 
-    The ``get_stems`` function returns a ``Date`` column which may
-    contain the literal string ``"vasket"`` or other non-date
-    values.  This helper attempts to parse ISO date strings and
-    returns them in ``YYYY-MM-DD`` format.  If parsing fails or the
-    input is not a valid date, ``None`` is returned.
+    This helper attempts to parse ISO date strings and returns them in
+    ``YYYY-MM-DD`` format.  If parsing fails or the input is not a
+    valid date, ``None`` is returned.
 
     :param date_str: Raw date string from optbuck.
     :returns: Normalised date string or None.
@@ -126,12 +175,339 @@ def _normalize_date(date_str: Optional[str]) -> Optional[str]:
             return None
 
 
+# Date layouts parsed for the whole column at once: (pattern, format).
+# Only strings matching a pattern exactly are parsed with the explicit
+# format, which accepts nothing that _normalize_date would reject
+# (years with a leading zero are left to _normalize_date).
+_DATE_FORMATS = (
+    (r"[1-9][0-9]{3}-[0-9]{2}-[0-9]{2}", "%Y-%m-%d"),
+    (r"[0-9]{2}\.[0-9]{2}\.[1-9][0-9]{3}", "%d.%m.%Y"),
+)
+
+
+def _normalize_dates(dates: "pd.Series") -> List[Optional[str]]:
+    """Normalize the date column from the harvester file.
+
+    The ``get_stems`` function returns a ``Date`` column which may
+    contain the literal string ``"vasket"`` or other non-date
+    values.  Values in one of the common layouts of
+    :data:`_DATE_FORMATS` are parsed for the whole column at once;
+    the remaining values are parsed once per distinct value with
+    :func:`_normalize_date`, so the result is the same as applying
+    :func:`_normalize_date` to every row.
+
+    :param dates: Raw date column from optbuck.
+    :returns: One normalised date string (``YYYY-MM-DD``) or None per
+        row.
+    """
+    result = pd.Series([None] * len(dates), index=dates.index, dtype=object)
+    text = dates.astype("string")
+    pending = text.notna().to_numpy(dtype=bool, copy=True)
+    for pattern, fmt in _DATE_FORMATS:
+        hit = text.str.fullmatch(pattern).fillna(False).to_numpy(dtype=bool) & pending
+        if not hit.any():
+            continue
+        parsed = pd.to_datetime(text[hit], format=fmt, errors="coerce")
+        ok = parsed.notna().to_numpy(dtype=bool)
+        # Invalid or out-of-range dates are left to the scalar parser
+        rows = np.flatnonzero(hit)[ok]
+        result.iloc[rows] = parsed[ok].dt.strftime("%Y-%m-%d").astype(object).to_numpy()
+        pending[rows] = False
+    if pending.any():
+        rest = dates[pending]
+        normalized = {value: _normalize_date(value) for value in rest.unique()}
+        result.iloc[np.flatnonzero(pending)] = [normalized[value] for value in rest]
+    return result.tolist()
+
+
+def _numeric(series: "pd.Series") -> "np.ndarray":
+    """Return a column as a float array, with unparseable values as NaN."""
+    return pd.to_numeric(series, errors="coerce").to_numpy(dtype=float)
+
+
+def _float_column(df: "pd.DataFrame", name: str, divisor: float = 1.0, *, keep_nan: bool = False) -> list:
+    """Extract a numeric column as a list of Python floats.
+
+    :param df: Source data frame.
+    :param name: Column name.  If the column is absent, a list of
+        ``None`` is returned.
+    :param divisor: Unit conversion factor that values are divided by.
+    :param keep_nan: Keep missing values as NaN instead of ``None``.
+    :returns: One value per row.
+    """
+    if name not in df.columns:
+        return [None] * len(df)
+    values = _numeric(df[name])
+    if divisor != 1.0:
+        values = values / divisor
+    if keep_nan:
+        return values.tolist()
+    return np.where(np.isnan(values), None, values).tolist()
+
+
+def _int_column(df: "pd.DataFrame", name: str) -> list:
+    """Extract a numeric column as a list of Python ints (``None`` if missing)."""
+    if name not in df.columns:
+        return [None] * len(df)
+    values = _numeric(df[name])
+    valid = ~np.isnan(values)
+    ints = np.where(valid, values, 0).astype(np.int64).tolist()
+    return [i if ok else None for i, ok in zip(ints, valid.tolist())]
+
+
+class _ColumnBuilder:
+    """Accumulate rows into per-column Python lists.
+
+    Appending to lists is cheap; each column is converted to a NumPy
+    array only once, in :meth:`to_frame`.
+
+    :param dtypes: Mapping of column name to NumPy dtype.  Missing
+        values are filled with NaN (float columns) or ``None`` (object
+        columns).
+    """
+
+    def __init__(self, dtypes: Dict[str, object]) -> None:
+        self._dtypes = {name: np.dtype(dtype) for name, dtype in dtypes.items()}
+        self._columns: Dict[str, list] = {name: [] for name in dtypes}
+        self._fill = {name: None if dtype == object else np.nan for name, dtype in self._dtypes.items()}
+        self._n = 0
+
+    def append(self, row: Dict[str, object]) -> None:
+        """Append a row given as a mapping of column name to value."""
+        fill = self._fill
+        for name, column in self._columns.items():
+            column.append(row.get(name, fill[name]))
+        self._n += 1
+
+    def __len__(self) -> int:
+        return self._n
+
+    def to_frame(self) -> "pd.DataFrame":
+        """Return the accumulated rows as a data frame."""
+        return pd.DataFrame(
+            {name: np.array(column, dtype=self._dtypes[name]) for name, column in self._columns.items()}
+        )
+
+
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace from an element tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _xml_float(text: Optional[str]) -> float:
+    """Parse element text as a float, returning NaN if it is not numeric."""
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _parse_hpr_stem(stem, stems: _ColumnBuilder, logs: _ColumnBuilder, profile: _ColumnBuilder) -> None:
+    """Append the stem, log and stem profile rows for one ``<Stem>`` element.
+
+    Logs are tagged with the position of their stem in ``stems``;
+    values derived from several logs are added by :func:`_hpr_frames`.
+    """
+    stem_index = len(stems)
+    row: Dict[str, object] = {}
+    processed = ()
+    for child in stem:
+        name = _local_name(child.tag)
+        if name in ("StemKey", "SpeciesGroupKey", "ComHeight"):
+            row[name] = _xml_float(child.text)
+        elif name == "HarvestDate" and child.text:
+            # Keep the date part of an ISO timestamp
+            row["Date"] = child.text.strip().split("T", 1)[0]
+        elif name == "StemCoordinates":
+            for coord in child:
+                coord_name = _local_name(coord.tag)
+                if coord_name in ("Latitude", "Longitude", "Altitude"):
+                    row[coord_name] = _xml_float(coord.text)
+        elif name == "SingleTreeProcessedStem":
+            processed = child
+    stem_key = row.get("StemKey", float("nan"))
+
+    diameters = []
+    grades = []
+    for child in processed:
+        name = _local_name(child.tag)
+        if name in ("DBH", "ComHeight"):
+            row[name] = _xml_float(child.text)
+        elif name == "Log":
+            log: Dict[str, object] = {"StemIndex": stem_index, "StemKey": stem_key}
+            for part in child:
+                part_name = _local_name(part.tag)
+                if part_name in ("LogKey", "ProductKey"):
+                    log[part_name] = _xml_float(part.text)
+                elif part_name == "LogVolume":
+                    category = part.get("logVolumeCategory")
+                    if category in ("m3sub", "m3sob"):
+                        log[category] = _xml_float(part.text)
+                elif part_name == "LogMeasurement":
+                    for measure in part:
+                        measure_name = _local_name(measure.tag)
+                        if measure_name == "LogLength":
+                            log["LogLength"] = _xml_float(measure.text)
+                        elif measure_name == "LogDiameter":
+                            category = (measure.get("logDiameterCategory") or "").replace(" ", "_")
+                            if category in ("Butt_ob", "Top_ob"):
+                                log[category] = _xml_float(measure.text)
+            logs.append(log)
+        elif name == "StemDiameters":
+            for value in child:
+                if _local_name(value.tag) == "DiameterValue":
+                    diameters.append((_xml_float(value.get("diameterPosition")), _xml_float(value.text)))
+        elif name == "StemGrade":
+            grades.append((_xml_float(child.get("gradeStartPosition")), _xml_float(child.text)))
+    stems.append(row)
+
+    # Each diameter takes the grade of the last grade section starting at
+    # or below its position
+    grades.sort()
+    grade_starts = [start for start, _ in grades]
+    for position, diameter in diameters:
+        i = bisect.bisect_right(grade_starts, position) - 1
+        profile.append(
+            {
+                "StemKey": stem_key,
+                "diameterPosition": position,
+                "DiameterValue": diameter,
+                "StemGrade": grades[i][1] if i >= 0 else float("nan"),
+            }
+        )
+
+
+def _hpr_columns():
+    """Return empty column builders for the stems, logs and stem profile."""
+    stems = _ColumnBuilder(
+        {
+            "StemKey": np.float64,
+            "SpeciesGroupKey": np.float64,
+            "Date": object,
+            "Latitude": np.float64,
+            "Longitude": np.float64,
+            "Altitude": np.float64,
+            "DBH": np.float64,
+            "ComHeight": np.float64,
+        }
+    )
+    logs = _ColumnBuilder(
+        {
+            "StemIndex": np.int64,
+            **{
+                name: np.float64
+                for name in ("StemKey", "LogKey", "ProductKey", "LogLength", "Butt_ob", "Top_ob", "m3sub", "m3sob")
+            },
+        }
+    )
+    profile = _ColumnBuilder(
+        {name: np.float64 for name in ("StemKey", "diameterPosition", "DiameterValue", "StemGrade")}
+    )
+    return stems, logs, profile
+
+
+def _hpr_frames(stems: _ColumnBuilder, logs: _ColumnBuilder, profile: _ColumnBuilder) -> tuple:
+    """Convert the parsed columns to data frames and add derived columns.
+
+    The start position of each log is the summed length of the
+    preceding logs of its stem, and the stem volumes are the sums of
+    its log volumes.  Both are computed per stem with grouped
+    operations that skip missing values, instead of per-log NaN tests.
+
+    :returns: Tuple of the stems, logs and stem profile data frames.
+    """
+    stems_df = stems.to_frame()
+    logs_df = logs.to_frame()
+    stem_index = logs_df.pop("StemIndex")
+    lengths = logs_df["LogLength"].fillna(0.0)
+    ends = lengths.groupby(stem_index).cumsum()
+    logs_df["StartPos"] = ends.groupby(stem_index).shift(fill_value=0.0)
+    volumes = logs_df[["m3sub", "m3sob"]].groupby(stem_index).sum(min_count=1)
+    volumes = volumes.reindex(np.arange(len(stems_df)))
+    stems_df["m3sub"] = volumes["m3sub"].to_numpy()
+    stems_df["m3sob"] = volumes["m3sob"].to_numpy()
+    return stems_df, logs_df, profile.to_frame()
+
+
+def _extract_all(xml_root) -> tuple:
+    """Extract all harvester tables from an already parsed HPR tree.
+
+    The stems, logs and stem profiles are collected in a single walk
+    over the ``<Stem>`` elements with :func:`_parse_hpr_stem`, rather
+    than one walk per table.
+
+    :param xml_root: Parsed HPR document as returned by
+        ``optbuck.get_xml_node``.
+    :returns: Tuple of the stems, logs and stem profile data frames and
+        the price matrices from ``optbuck.get_price_matrices``.
+    """
+    stems, logs, profile = _hpr_columns()
+    for stem in xml_root.iterfind(".//{*}Stem"):
+        _parse_hpr_stem(stem, stems, logs, profile)
+    return (*_hpr_frames(stems, logs, profile), optbuck.get_price_matrices(xml_root))
+
+
+def _fast_parse_hpr(path: str) -> Dict[str, object]:
+    """Stream-parse the stems of a StanForD 2010 HPR file.
+
+    Unlike the optbuck path, which builds the complete XML tree before
+    walking it, ``<Stem>`` elements are processed one at a time with
+    ``iterparse`` and removed from the tree afterwards, so memory use
+    stays flat regardless of file size.  ``lxml`` is used when
+    available; the standard library parser is the fallback.
+
+    The returned data frames use the optbuck column names for the
+    fields read here.  Stem volumes are the sums of the log volumes
+    and log start positions the cumulative lengths of the preceding
+    logs.  The rest of the document, which holds the product and price
+    matrix definitions, is kept so that the price matrices can be read
+    from it without parsing the file again.
+
+    :param path: Path to the .hpr file.
+    :returns: Dictionary with ``stems``, ``logs`` and ``stem_profile``
+        data frames and the ``document`` root element without its
+        ``<Stem>`` elements.
+    """
+    stems, logs, profile = _hpr_columns()
+    if etree is not None:
+        context = etree.iterparse(path, events=("end",), tag="{*}Stem")
+        for _, elem in context:
+            _parse_hpr_stem(elem, stems, logs, profile)
+            elem.getparent().remove(elem)
+        root = context.root
+    else:
+        root = None
+        parents = []
+        for event, elem in ElementTree.iterparse(path, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = elem
+                parents.append(elem)
+                continue
+            parents.pop()
+            if _local_name(elem.tag) == "Stem":
+                _parse_hpr_stem(elem, stems, logs, profile)
+                parents[-1].remove(elem)
+
+    stems_df, logs_df, profile_df = _hpr_frames(stems, logs, profile)
+    return {"stems": stems_df, "logs": logs_df, "stem_profile": profile_df, "document": root}
+
+
+def _records(columns: Dict[str, list]) -> List[Dict[str, object]]:
+    """Turn a mapping of equal-length columns into a list of row dictionaries."""
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+
 def import_harvester_hpr(
     *,
     hpr_path: str,
     campaign_uid: str,
     output_root: str = "assets/harvester",  # default subdir for raw HPR files
     currency: str = "EUR",
+    fast: bool = False,
+    single_pass: bool = False,
+    columnar: bool = False,
 ) -> Dict[str, object]:
     """Import a StanForD 2010 harvester production file (HPR).
 
@@ -156,6 +532,20 @@ def import_harvester_hpr(
         ``"assets/harvester"``.  The final path will be
         ``{output_root}/{campaign_uid}/{filename}``.
     :param currency: Currency code to assign to price matrix records.
+    :param fast: Stream the stems, logs and stem profiles with
+        :func:`_fast_parse_hpr` instead of building the complete tree
+        with optbuck.  This mode is also used when optbuck is not
+        installed.  The price matrices are read by optbuck from the
+        rest of the document; without optbuck no price matrix records
+        are returned.
+    :param single_pass: On the optbuck path, extract the stems, logs
+        and stem profiles from optbuck's tree in a single walk with
+        :func:`_extract_all` instead of one walk per table.  Ignored
+        when ``fast`` is set.
+    :param columnar: Return each table as a dictionary mapping column
+        names to lists of values instead of a list of per-row
+        dictionaries.  This avoids building one dictionary per row, and
+        ``zip(*table.values())`` yields rows ready for ``executemany``.
     :returns: A dictionary with the following keys:
         ``asset_record`` (metadata for the raw HPR file), ``stems``
         (list of harvester_stems records), ``logs`` (list of
@@ -164,7 +554,12 @@ def import_harvester_hpr(
         harvester_price_matrix records).
     """
 
-    _ensure_optbuck()
+    if not fast:
+        fast = optbuck is None
+    if np is None or pd is None:
+        raise ImportError(
+            "numpy and pandas must be installed to use import_harvester_hpr"
+        )
 
     if not os.path.isfile(hpr_path):
         raise FileNotFoundError(f"Harvester file does not exist: {hpr_path}")
@@ -177,17 +572,12 @@ def import_harvester_hpr(
 
     # Copy the file into the dataset bundle if it doesn’t already exist
     if not os.path.abspath(hpr_path) == os.path.abspath(dest_path):
-        # Copy file contents
-        with open(hpr_path, "rb") as src, open(dest_path, "wb") as dst:
-            while True:
-                buf = src.read(65536)
-                if not buf:
-                    break
-                dst.write(buf)
-
-    # Generate asset UID and gather metadata
+        meta = _copy_and_hash(hpr_path, dest_path)
+    else:
+        meta = _file_metadata(dest_path)
+
+    # Generate asset UID
     asset_uid = _make_asset_uid()
-    meta = _file_metadata(dest_path)
     asset_record = {
         "asset_uid": asset_uid,
         "campaign_uid": campaign_uid,
@@ -205,151 +595,141 @@ def import_harvester_hpr(
         "notes": None,
     }
 
-    # Parse the HPR file using optbuck
-    xml_root = optbuck.get_xml_node(hpr_path)
-    stems_df = optbuck.get_stems(xml_root)
-    logs_df = optbuck.get_logs(xml_root)
-    stemprof_df = optbuck.get_stemprofile(xml_root, logs_df)
-    price_matrices = optbuck.get_price_matrices(xml_root)
-
-    # Convert stems DataFrame into records
-    stems: List[Dict[str, object]] = []
-    for _, row in stems_df.iterrows():
-        stem_key = int(row["StemKey"])
-        stem_uid = f"{campaign_uid}_stem_{stem_key}"
-
-        # Coordinates: if latitude/longitude are present, use them
-        lat = row.get("Latitude")
-        lon = row.get("Longitude")
-        alt = row.get("Altitude")
-        position_lat = float(lat) if lat is not None else None
-        position_lon = float(lon) if lon is not None else None
-        # Altitude is likely centimetres; convert to metres if numeric
-        if alt is not None and not (alt != alt):  # check for NaN
-            try:
-                # Some HPR files store altitude as mm or cm; scale to m
-                alt_val = float(alt)
-                # If altitude is implausibly large (>500), assume cm and divide by 100
-                position_alt = alt_val / 100.0 if alt_val > 500.0 else alt_val / 1000.0
-            except Exception:
-                position_alt = None
+    # Parse the HPR file, with optbuck's per-table functions unless the
+    # fast path was requested
+    if fast:
+        frames = _fast_parse_hpr(hpr_path)
+        stems_df = frames["stems"]
+        logs_df = frames["logs"]
+        stemprof_df = frames["stem_profile"]
+        if optbuck is not None:
+            price_matrices = optbuck.get_price_matrices(frames["document"])
         else:
-            position_alt = None
-
-        # DBH in data is in mm; convert to centimetres
-        dbh_raw = row.get("DBH")
-        dbh_cm = float(dbh_raw) / 10.0 if dbh_raw is not None else None
-
-        # Computed height (ComHeight) appears to be centimetres; convert to metres
-        com_height = row.get("ComHeight")
-        height_m = float(com_height) / 100.0 if com_height is not None else None
-
-        stems.append(
-            {
-                "stem_uid": stem_uid,
-                "asset_uid": asset_uid,
-                "stem_key": stem_key,
-                "species_group_key": int(row.get("SpeciesGroupKey"))
-                if row.get("SpeciesGroupKey") == row.get("SpeciesGroupKey")
-                else None,
-                "harvest_date": _normalize_date(row.get("Date")),
-                "position_lat": position_lat,
-                "position_lon": position_lon,
-                "altitude_m": position_alt,
-                "dbh_cm": dbh_cm,
-                "volume_m3_sub": float(row.get("m3sub")) if row.get("m3sub") == row.get("m3sub") else None,
-                "volume_m3_sob": float(row.get("m3sob")) if row.get("m3sob") == row.get("m3sob") else None,
-                "computed_height_m": height_m,
-            }
-        )
-
-    # Convert logs DataFrame into records
-    logs: List[Dict[str, object]] = []
-    for _, row in logs_df.iterrows():
-        stem_key = int(row["StemKey"])
-        log_key = int(row["LogKey"])
-        stem_uid = f"{campaign_uid}_stem_{stem_key}"
-        log_uid = f"{stem_uid}_log_{log_key}"
+            price_matrices = {}
+    else:
+        _ensure_optbuck()
+        xml_root = optbuck.get_xml_node(hpr_path)
+        if single_pass and hasattr(xml_root, "iterfind"):
+            stems_df, logs_df, stemprof_df, price_matrices = _extract_all(xml_root)
+        else:
+            stems_df = optbuck.get_stems(xml_root)
+            logs_df = optbuck.get_logs(xml_root)
+            stemprof_df = optbuck.get_stemprofile(xml_root, logs_df)
+            price_matrices = optbuck.get_price_matrices(xml_root)
+
+    # Convert stems DataFrame into columns.  Each column is extracted
+    # and unit-converted once as a NumPy array rather than per row.
+    n_stems = len(stems_df)
+    stem_keys = stems_df["StemKey"].to_numpy().astype(np.int64).tolist()
+    # Coordinates: if latitude/longitude are present, use them
+    position_lat = _float_column(stems_df, "Latitude", keep_nan=True)
+    position_lon = _float_column(stems_df, "Longitude", keep_nan=True)
+    # Altitude is likely centimetres or millimetres; if implausibly large
+    # (>500), assume cm and divide by 100, otherwise divide by 1000
+    if "Altitude" in stems_df.columns:
+        alt = _numeric(stems_df["Altitude"])
+        alt_m = np.where(alt > 500.0, alt / 100.0, alt / 1000.0)
+        position_alt = np.where(np.isnan(alt_m), None, alt_m).tolist()
+    else:
+        position_alt = [None] * n_stems
+    # DBH in data is in mm; convert to centimetres
+    dbh_cm = _float_column(stems_df, "DBH", 10.0, keep_nan=True)
+    # Computed height (ComHeight) appears to be centimetres; convert to metres
+    height_m = _float_column(stems_df, "ComHeight", 100.0, keep_nan=True)
+    species_group_key = _int_column(stems_df, "SpeciesGroupKey")
+    dates = _normalize_dates(stems_df["Date"]) if "Date" in stems_df.columns else [None] * n_stems
+    volume_sub = _float_column(stems_df, "m3sub")
+    volume_sob = _float_column(stems_df, "m3sob")
+
+    stems = {
+        "stem_uid": [f"{campaign_uid}_stem_{stem_key}" for stem_key in stem_keys],
+        "asset_uid": [asset_uid] * n_stems,
+        "stem_key": stem_keys,
+        "species_group_key": species_group_key,
+        "harvest_date": dates,
+        "position_lat": position_lat,
+        "position_lon": position_lon,
+        "altitude_m": position_alt,
+        "dbh_cm": dbh_cm,
+        "volume_m3_sub": volume_sub,
+        "volume_m3_sob": volume_sob,
+        "computed_height_m": height_m,
+    }
 
+    # Convert logs DataFrame into columns
+    n_logs = len(logs_df)
+    log_stem_keys = logs_df["StemKey"].to_numpy().astype(np.int64).tolist()
+    log_keys = logs_df["LogKey"].to_numpy().astype(np.int64).tolist()
+    logs = {
+        "log_uid": [
+            f"{campaign_uid}_stem_{stem_key}_log_{log_key}" for stem_key, log_key in zip(log_stem_keys, log_keys)
+        ],
+        "stem_uid": [f"{campaign_uid}_stem_{stem_key}" for stem_key in log_stem_keys],
+        "log_key": log_keys,
+        "product_key": _int_column(logs_df, "ProductKey"),
         # StartPos and LogLength appear to be centimetres; leave as cm
-        start_pos_cm = float(row.get("StartPos")) if row.get("StartPos") == row.get("StartPos") else None
-        length_cm = float(row.get("LogLength")) if row.get("LogLength") == row.get("LogLength") else None
+        "start_pos_cm": _float_column(logs_df, "StartPos"),
+        "length_cm": _float_column(logs_df, "LogLength"),
         # Diameters are in millimetres; convert to centimetres
-        butt_cm = float(row.get("Butt_ob")) / 10.0 if row.get("Butt_ob") == row.get("Butt_ob") else None
-        top_cm = float(row.get("Top_ob")) / 10.0 if row.get("Top_ob") == row.get("Top_ob") else None
-        volume_m3 = float(row.get("m3sub")) if row.get("m3sub") == row.get("m3sub") else None
+        "butt_diameter_cm": _float_column(logs_df, "Butt_ob", 10.0),
+        "top_diameter_cm": _float_column(logs_df, "Top_ob", 10.0),
+        "volume_m3": _float_column(logs_df, "m3sub"),
+        "quality_grade": [None] * n_logs,
+    }
 
-        logs.append(
-            {
-                "log_uid": log_uid,
-                "stem_uid": stem_uid,
-                "log_key": log_key,
-                "product_key": int(row.get("ProductKey"))
-                if row.get("ProductKey") == row.get("ProductKey")
-                else None,
-                "start_pos_cm": start_pos_cm,
-                "length_cm": length_cm,
-                "butt_diameter_cm": butt_cm,
-                "top_diameter_cm": top_cm,
-                "volume_m3": volume_m3,
-                "quality_grade": None,
-            }
-        )
+    # Convert stem profile DataFrame into columns.  Rows are ordered by
+    # StemKey (keeping their original order within a stem) and numbered
+    # sequentially per stem to give the profile_index.
+    profile_df = stemprof_df[stemprof_df["StemKey"].notna()].sort_values("StemKey", kind="stable")
+    stem_profile = {
+        "stem_uid": [
+            f"{campaign_uid}_stem_{stem_key}"
+            for stem_key in profile_df["StemKey"].to_numpy().astype(np.int64).tolist()
+        ],
+        "profile_index": (profile_df.groupby("StemKey", sort=False).cumcount() + 1).tolist(),
+        # diameterPosition appears to be in centimetres or decimetres; assume centimetres
+        "height_cm": _float_column(profile_df, "diameterPosition"),
+        # DiameterValue is in millimetres
+        "diameter_mm": _float_column(profile_df, "DiameterValue"),
+        "stem_grade": _int_column(profile_df, "StemGrade"),
+    }
 
-    # Convert stem profile DataFrame into records
-    stem_profile: List[Dict[str, object]] = []
-    # Group by StemKey to assign profile_index sequentially
-    profile_groups = stemprof_df.groupby("StemKey")
-    for stem_key, group in profile_groups:
-        stem_uid = f"{campaign_uid}_stem_{int(stem_key)}"
-        for idx, (_, row) in enumerate(group.iterrows(), start=1):
-            # diameterPosition appears to be in centimetres or decimetres; assume centimetres
-            pos_cm = float(row.get("diameterPosition")) if row.get("diameterPosition") == row.get("diameterPosition") else None
-            # DiameterValue is in millimetres
-            diam_mm = float(row.get("DiameterValue")) if row.get("DiameterValue") == row.get("DiameterValue") else None
-            grade_val = int(row.get("StemGrade")) if row.get("StemGrade") == row.get("StemGrade") else None
-            stem_profile.append(
-                {
-                    "stem_uid": stem_uid,
-                    "profile_index": idx,
-                    "height_cm": pos_cm,
-                    "diameter_mm": diam_mm,
-                    "stem_grade": grade_val,
-                }
-            )
-
-    # Convert price matrices into records
-    price_matrix: List[Dict[str, object]] = []
+    # Convert price matrices into columns
+    price_matrix: Dict[str, list] = {
+        "asset_uid": [],
+        "product_key": [],
+        "length_class_m": [],
+        "diameter_class_cm": [],
+        "price": [],
+        "currency": [],
+    }
     for product_key, df in price_matrices.items():
         # Skip waste key (usually 999999) because it contains default values
         try:
             pk_int = int(product_key)
         except Exception:
             continue
-        # Flatten the pivot table: index lCLL (length lower limit), columns dCLL
-        for lcll, row in df.iterrows():
-            for dcll, price in row.items():
-                if price != price:  # skip NaN
-                    continue
-                # lCLL appears to be millimetres; convert to metres
-                length_m = float(lcll) / 100.0
-                # dCLL appears to be millimetres; convert to centimetres
-                diameter_cm = float(dcll) / 10.0
-                price_matrix.append(
-                    {
-                        "asset_uid": asset_uid,
-                        "product_key": pk_int,
-                        "length_class_m": length_m,
-                        "diameter_class_cm": diameter_cm,
-                        "price": float(price),
-                        "currency": currency,
-                    }
-                )
-
-    return {
-        "asset_record": asset_record,
+        # Flatten the pivot table: index lCLL (length lower limit), columns
+        # dCLL.  The (row, column) positions of the non-NaN cells come out
+        # of np.nonzero in row-major order, matching a row-by-row walk.
+        prices = df.to_numpy(dtype=float)
+        rows, cols = np.nonzero(~np.isnan(prices))
+        n_cells = len(rows)
+        price_matrix["asset_uid"].extend([asset_uid] * n_cells)
+        price_matrix["product_key"].extend([pk_int] * n_cells)
+        # lCLL appears to be millimetres; convert to metres
+        price_matrix["length_class_m"].extend((df.index.to_numpy(dtype=float)[rows] / 100.0).tolist())
+        # dCLL appears to be millimetres; convert to centimetres
+        price_matrix["diameter_class_cm"].extend((df.columns.to_numpy(dtype=float)[cols] / 10.0).tolist())
+        price_matrix["price"].extend(prices[rows, cols].tolist())
+        price_matrix["currency"].extend([currency] * n_cells)
+
+    tables = {
         "stems": stems,
         "logs": logs,
         "stem_profile": stem_profile,
         "price_matrix": price_matrix,
     }
+    if not columnar:
+        tables = {name: _records(columns) for name, columns in tables.items()}
+    return {"asset_record": asset_record, **tables}
@@ -38,8 +38,12 @@ records that the caller can use to populate the ``assets`` table.
 
 from __future__ import annotations
 
+import functools
+import multiprocessing
+import operator
 import os
-from typing import List, Dict, Optional, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Iterable, Tuple
 
 try:
     import numpy as np
@@ -85,6 +89,8 @@ def import_campaign_tree_packs(
     include_residual: bool = True,
     output_root: str = "pointclouds/campaigns",
     chunk_size: int = 1_000_000,
+    buffer_points: int = 0,
+    max_workers: Optional[int] = None,
 ) -> List[Dict[str, object]]:
     """Import a set of LAS/LAZ files as tree packs for a campaign.
 
@@ -108,6 +114,11 @@ def import_campaign_tree_packs(
     caller is responsible for recording the mapping of dimension names
     (via the ``dims_json`` in the ``campaigns`` table).
 
+    Input files are processed one after another unless
+    ``max_workers`` asks for worker processes.  The workers are
+    spawned, so scripts that use them must guard their entry point
+    with ``if __name__ == "__main__":``.
+
     :param campaign_uid: Unique identifier for the campaign.
     :param input_paths: Iterable of input LAS/LAZ file paths.
     :param instance_dim: Name of the instance segmentation dimension in
@@ -127,6 +138,15 @@ def import_campaign_tree_packs(
         ``{output_root}/{campaign_uid}/tiles``.
     :param chunk_size: Number of points to process per chunk.  Larger
         values reduce overhead but increase memory usage.
+    :param buffer_points: If positive, the points selected for each
+        output file are collected in a preallocated buffer of this many
+        points and written whenever it fills up, so that laspy gets
+        fewer, larger writes.  Each buffer holds ``buffer_points``
+        point records, three per tile being processed.  ``0`` (the
+        default) writes every chunk subset as it is produced.
+    :param max_workers: Number of worker processes used to process
+        several tiles at once.  ``None`` (the default) or ``1``
+        processes the tiles sequentially in the calling process.
     :returns: A list of dictionaries describing the generated assets.
     Each dictionary contains keys suitable for insertion into the
     ``assets`` table (e.g. ``asset_uid``, ``campaign_uid``, ``uri``,
@@ -139,141 +159,289 @@ def import_campaign_tree_packs(
             "laspy and numpy must be installed to use import_campaign_tree_packs"
         )
 
-    ground_codes = np.array(list(ground_classes), dtype=int)
-    tree_codes = np.array(list(tree_classes), dtype=int)
+    ground_codes = [int(c) for c in ground_classes]
+    tree_codes = [int(c) for c in tree_classes]
 
     campaign_dir = os.path.join(output_root, campaign_uid, "tiles")
     os.makedirs(campaign_dir, exist_ok=True)
 
-    asset_records: List[Dict[str, object]] = []
+    tiles = []
     for index, input_path in enumerate(input_paths):
         if not os.path.isfile(input_path):
             raise FileNotFoundError(f"Input path does not exist: {input_path}")
-        tile_id = _derive_tile_id(input_path, index)
-
-        # Prepare output file paths
-        tree_pack_path = os.path.join(campaign_dir, f"{tile_id}_tree_pack.laz")
-        ground_only_path = os.path.join(campaign_dir, f"{tile_id}_ground_only.laz")
-        residual_path = os.path.join(campaign_dir, f"{tile_id}_residual.laz")
-
-        # Open reader and prepare writers
-        with laspy.open(input_path) as reader:
-            header = reader.header
-
-            # Copy header for each writer so point format and VLRs are preserved
-            tree_header = header.copy()
-            ground_header = header.copy()
-            residual_header = header.copy()
-
-            # Write outputs with the same point format and header
-            with laspy.open(tree_pack_path, mode="w", header=tree_header) as tree_writer, \
-                 laspy.open(ground_only_path, mode="w", header=ground_header) as ground_writer, \
-                 (laspy.open(residual_path, mode="w", header=residual_header) if include_residual else _NullWriter()) as residual_writer:
-
-                # Track counts and bounding boxes
-                counts = {"tree": 0, "ground": 0, "residual": 0}
-                bboxes = {
-                    "tree": None,
-                    "ground": None,
-                    "residual": None,
-                }
-
-                for points in reader.chunk_iterator(chunk_size):
-                    # `points` is a LasData containing arrays for each dimension
-                    sem = points[semantic_dim]
-                    inst = points[instance_dim] if instance_dim in points.point_format.extra_dimension_names else None
+        tiles.append((input_path, _derive_tile_id(input_path, index)))
+
+    # Tiles are independent read -> classify -> write pipelines, so
+    # several tiles can be processed at once in worker processes.
+    process_tile = functools.partial(
+        _process_one_tile,
+        campaign_uid=campaign_uid,
+        campaign_dir=campaign_dir,
+        output_root=output_root,
+        instance_dim=instance_dim,
+        semantic_dim=semantic_dim,
+        tree_codes=tuple(tree_codes),
+        ground_codes=tuple(ground_codes),
+        include_residual=include_residual,
+        chunk_size=chunk_size,
+        buffer_points=buffer_points,
+    )
+    asset_records: List[Dict[str, object]] = []
+    if max_workers is None or max_workers <= 1 or len(tiles) <= 1:
+        for input_path, tile_id in tiles:
+            asset_records.extend(process_tile(input_path, tile_id))
+    else:
+        # Spawn the workers: a forked child can deadlock in the LAZ
+        # backend if the parent has already decoded LAZ data
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(len(tiles), max_workers), mp_context=context) as ex:
+            for records in ex.map(process_tile, *zip(*tiles)):
+                asset_records.extend(records)
+    return asset_records
+
+
+def _process_one_tile(
+    input_path: str,
+    tile_id: str,
+    *,
+    campaign_uid: str,
+    campaign_dir: str,
+    output_root: str,
+    instance_dim: str,
+    semantic_dim: str,
+    tree_codes: Tuple[int, ...],
+    ground_codes: Tuple[int, ...],
+    include_residual: bool,
+    chunk_size: int,
+    buffer_points: int,
+) -> List[Dict[str, object]]:
+    """Split one input tile into its tree pack, ground and residual files.
+
+    See :func:`import_campaign_tree_packs` for the meaning of the
+    arguments; ``campaign_dir`` is the campaign's ``tiles`` directory.
 
+    :returns: The asset records of the files written for this tile.
+    """
+    asset_records: List[Dict[str, object]] = []
+    # Prepare output file paths
+    tree_pack_path = os.path.join(campaign_dir, f"{tile_id}_tree_pack.laz")
+    ground_only_path = os.path.join(campaign_dir, f"{tile_id}_ground_only.laz")
+    residual_path = os.path.join(campaign_dir, f"{tile_id}_residual.laz")
+
+    # Open reader and prepare writers
+    with laspy.open(input_path) as reader:
+        header = reader.header
+        sem_dtype = header.point_format.dimension_by_name(semantic_dim).dtype
+        role_lut = _role_lut(sem_dtype, tree_codes, ground_codes)
+        role_index = _role_index_dtype(sem_dtype)
+        has_inst = instance_dim in header.point_format.extra_dimension_names
+
+        # Copy header for each writer so point format and VLRs are preserved
+        tree_header = header.copy()
+        ground_header = header.copy()
+        residual_header = header.copy()
+
+        # Write outputs with the same point format and header
+        residual_output = residual_path if include_residual else None
+        with _open_output(tree_pack_path, tree_header, buffer_points) as tree_writer, \
+             _open_output(ground_only_path, ground_header, buffer_points) as ground_writer, \
+             _open_output(residual_output, residual_header, buffer_points) as residual_writer:
+
+            # Track counts and bounding boxes
+            counts = {"tree": 0, "ground": 0, "residual": 0}
+            bboxes = {
+                "tree": _new_bbox(),
+                "ground": _new_bbox(),
+                "residual": _new_bbox(),
+            }
+
+            # Bind the functions called for every chunk to locals
+            flatnonzero = np.flatnonzero
+            logical_and = np.logical_and
+            logical_not = np.logical_not
+            class_mask = _class_mask
+            update_bbox = _update_bbox
+            write_tree = tree_writer.write_points
+            write_ground = ground_writer.write_points
+            write_residual = residual_writer.write_points
+
+            for points in reader.chunk_iterator(chunk_size):
+                # `points` is a LasData containing arrays for each dimension
+                sem = points[semantic_dim]
+                inst = points[instance_dim] if has_inst else None
+
+                if role_lut is not None:
+                    # One gather classifies every point; the role bits
+                    # are 0/1 bytes and can be viewed as booleans
+                    role = role_lut[np.asarray(sem).view(role_index)]
+                    mask_tree = (role & _ROLE_TREE).view(bool)
+                    mask_ground = (role >> 1).view(bool)
+                else:
                     # Identify tree points
-                    mask_tree = np.isin(sem, tree_codes)
+                    mask_tree = class_mask(sem, tree_codes)
                     # Identify ground points
-                    mask_ground = np.isin(sem, ground_codes)
-                    # Identify residual points (tree semantic but no valid instance)
-                    if include_residual:
-                        if inst is None:
-                            mask_residual = mask_tree.copy()
-                        else:
-                            # Consider instance <= 0 or NaN as invalid
-                            mask_residual = mask_tree & ((inst <= 0) | np.isnan(inst))
-                        mask_tree = mask_tree & ~mask_residual  # remove residual from tree mask
+                    mask_ground = class_mask(sem, ground_codes)
+                # Identify residual points (tree semantic but no valid instance)
+                if include_residual:
+                    if inst is None:
+                        # Every tree point is residual
+                        mask_residual = mask_tree
+                        mask_tree = np.zeros_like(mask_residual)
                     else:
-                        mask_residual = None
-
-                    # Write tree points
-                    if mask_tree.any():
-                        tree_writer.write_points(points[mask_tree])
-                        counts["tree"] += int(mask_tree.sum())
-                        bboxes["tree"] = _update_bbox(bboxes["tree"], points[mask_tree])
-
-                    # Write ground points
-                    if mask_ground.any():
-                        ground_writer.write_points(points[mask_ground])
-                        counts["ground"] += int(mask_ground.sum())
-                        bboxes["ground"] = _update_bbox(bboxes["ground"], points[mask_ground])
-
-                    # Write residual points if enabled
-                    if include_residual and mask_residual is not None and mask_residual.any():
-                        residual_writer.write_points(points[mask_residual])
-                        counts["residual"] += int(mask_residual.sum())
-                        bboxes["residual"] = _update_bbox(bboxes["residual"], points[mask_residual])
-
-        # Determine EPSG code from header
-        crs_epsg = getattr(header, "epsg_code", None)
-
-        # Populate asset records
-        # Tree pack asset
+                        # Consider instance <= 0 or NaN as invalid
+                        invalid = inst <= 0
+                        if np.asarray(inst).dtype.kind == "f":
+                            invalid |= np.isnan(inst)
+                        mask_residual = mask_tree & invalid
+                        # Remove residual points from the tree mask in place
+                        logical_not(invalid, out=invalid)
+                        logical_and(mask_tree, invalid, out=mask_tree)
+                else:
+                    mask_residual = None
+
+                # Write tree points.  Each mask is converted to an
+                # index array once and the selected subset is reused
+                # for the write and the bbox update.
+                idx_tree = flatnonzero(mask_tree)
+                if idx_tree.size:
+                    sub = points[idx_tree]
+                    write_tree(sub)
+                    counts["tree"] += idx_tree.size
+                    update_bbox(bboxes["tree"], sub)
+
+                # Write ground points
+                idx_ground = flatnonzero(mask_ground)
+                if idx_ground.size:
+                    sub = points[idx_ground]
+                    write_ground(sub)
+                    counts["ground"] += idx_ground.size
+                    update_bbox(bboxes["ground"], sub)
+
+                # Write residual points if enabled
+                if include_residual and mask_residual is not None:
+                    idx_residual = flatnonzero(mask_residual)
+                    if idx_residual.size:
+                        sub = points[idx_residual]
+                        write_residual(sub)
+                        counts["residual"] += idx_residual.size
+                        update_bbox(bboxes["residual"], sub)
+
+    # Determine EPSG code from header
+    crs_epsg = getattr(header, "epsg_code", None)
+
+    # Populate asset records
+    # Tree pack asset
+    asset_records.append({
+        "asset_uid": f"pc_{campaign_uid}_{tile_id}_tree_pack",
+        "campaign_uid": campaign_uid,
+        "tree_uid": None,
+        "scope": "tile",
+        "pc_role": "tree_pack",
+        "asset_type": "pointcloud",
+        "format": "LAZ",
+        "uri": os.path.relpath(tree_pack_path, output_root),
+        "crs_epsg": crs_epsg,
+        "point_count": counts["tree"],
+        "bytes": _file_size(tree_pack_path),
+        "hash": None,  # hash can be computed externally
+        "created_at": None,
+        "notes": None,
+    })
+    asset_records.append({
+        "asset_uid": f"pc_{campaign_uid}_{tile_id}_ground_only",
+        "campaign_uid": campaign_uid,
+        "tree_uid": None,
+        "scope": "tile",
+        "pc_role": "ground_only",
+        "asset_type": "pointcloud",
+        "format": "LAZ",
+        "uri": os.path.relpath(ground_only_path, output_root),
+        "crs_epsg": crs_epsg,
+        "point_count": counts["ground"],
+        "bytes": _file_size(ground_only_path),
+        "hash": None,
+        "created_at": None,
+        "notes": None,
+    })
+    if include_residual:
         asset_records.append({
-            "asset_uid": f"pc_{campaign_uid}_{tile_id}_tree_pack",
+            "asset_uid": f"pc_{campaign_uid}_{tile_id}_residual",
             "campaign_uid": campaign_uid,
             "tree_uid": None,
             "scope": "tile",
-            "pc_role": "tree_pack",
+            "pc_role": "background_residual",
             "asset_type": "pointcloud",
             "format": "LAZ",
-            "uri": os.path.relpath(tree_pack_path, output_root),
+            "uri": os.path.relpath(residual_path, output_root),
             "crs_epsg": crs_epsg,
-            "point_count": counts["tree"],
-            "bytes": _file_size(tree_pack_path),
-            "hash": None,  # hash can be computed externally
-            "created_at": None,
-            "notes": None,
-        })
-        asset_records.append({
-            "asset_uid": f"pc_{campaign_uid}_{tile_id}_ground_only",
-            "campaign_uid": campaign_uid,
-            "tree_uid": None,
-            "scope": "tile",
-            "pc_role": "ground_only",
-            "asset_type": "pointcloud",
-            "format": "LAZ",
-            "uri": os.path.relpath(ground_only_path, output_root),
-            "crs_epsg": crs_epsg,
-            "point_count": counts["ground"],
-            "bytes": _file_size(ground_only_path),
+            "point_count": counts["residual"],
+            "bytes": _file_size(residual_path),
             "hash": None,
             "created_at": None,
             "notes": None,
         })
-        if include_residual:
-            asset_records.append({
-                "asset_uid": f"pc_{campaign_uid}_{tile_id}_residual",
-                "campaign_uid": campaign_uid,
-                "tree_uid": None,
-                "scope": "tile",
-                "pc_role": "background_residual",
-                "asset_type": "pointcloud",
-                "format": "LAZ",
-                "uri": os.path.relpath(residual_path, output_root),
-                "crs_epsg": crs_epsg,
-                "point_count": counts["residual"],
-                "bytes": _file_size(residual_path),
-                "hash": None,
-                "created_at": None,
-                "notes": None,
-            })
 
     return asset_records
 
 
+# Class sets up to this size are matched with chained ``==`` comparisons
+_SMALL_CLASS_SET = 4
+
+
+def _class_mask(values: np.ndarray, codes: List[int]) -> np.ndarray:
+    """Return a boolean mask of the values that are one of ``codes``.
+
+    The usual one to four classes are tested with ``==`` comparisons
+    OR-ed together, which is faster than :func:`numpy.isin` for such
+    small sets; larger sets use :func:`numpy.isin`.
+
+    :param values: Array of semantic codes.
+    :param codes: Codes to match.
+    :returns: Boolean array of the same shape as ``values``.
+    """
+    if 0 < len(codes) <= _SMALL_CLASS_SET:
+        return functools.reduce(operator.or_, (values == c for c in codes))
+    return np.isin(values, codes)
+
+
+# Role bits stored in the semantic code lookup table
+_ROLE_TREE = 1
+_ROLE_GROUND = 2
+
+
+def _role_lut(dtype, tree_codes: List[int], ground_codes: List[int]) -> Optional[np.ndarray]:
+    """Build a semantic code to role lookup table.
+
+    For 8- and 16-bit integer semantic dimensions every possible code
+    gets an entry holding :data:`_ROLE_TREE` and/or :data:`_ROLE_GROUND`,
+    so a chunk is classified with a single gather instead of one
+    comparison pass per class set.  Signed codes are indexed through
+    their unsigned two's complement view (see :func:`_role_index_dtype`).
+
+    :param dtype: Dtype of the semantic dimension.
+    :param tree_codes: Semantic codes of tree points.
+    :param ground_codes: Semantic codes of ground points.
+    :returns: The lookup table, or ``None`` if the dimension is not a
+        small integer type.
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind not in "iu" or dtype.itemsize > 2:
+        return None
+    info = np.iinfo(dtype)
+    size = 1 << (8 * dtype.itemsize)
+    lut = np.zeros(size, dtype=np.uint8)
+    for codes, role in ((tree_codes, _ROLE_TREE), (ground_codes, _ROLE_GROUND)):
+        for code in codes:
+            if info.min <= code <= info.max:
+                lut[code & (size - 1)] |= role
+    return lut
+
+
+def _role_index_dtype(dtype) -> np.dtype:
+    """Return the unsigned dtype used to index a :func:`_role_lut` table."""
+    return np.dtype(f"u{np.dtype(dtype).itemsize}")
+
+
 class _NullWriter:
     """Context manager that acts like a laspy writer but does nothing.
 
@@ -292,32 +460,103 @@ class _NullWriter:
         return None
 
 
-def _update_bbox(current_bbox, points: laspy.LasData):
-    """Update a bounding box with the points from a chunk.
+class _BufferedWriter:
+    """Context manager that coalesces point subsets into larger writes.
 
-    :param current_bbox: A tuple ``((min_x, min_y, min_z), (max_x, max_y, max_z))``
-        or ``None`` if no bbox exists yet.
-    :param points: A ``LasData`` object containing point arrays.
-    :returns: Updated bounding box.
+    Points passed to ``write_points`` are copied into a point record
+    preallocated for ``capacity`` points, which is handed to a laspy
+    writer whenever it is full and once more on exit.  Memory use is
+    bounded by the buffer regardless of the size of the file.
+
+    :param path: Output file path.
+    :param header: Header for the output file.
+    :param capacity: Number of points held by the buffer.
     """
-    # Extract coordinates
-    xs = points.x
-    ys = points.y
-    zs = points.z
-    # Compute min and max for this chunk
-    chunk_min = (float(xs.min()), float(ys.min()), float(zs.min()))
-    chunk_max = (float(xs.max()), float(ys.max()), float(zs.max()))
-    if current_bbox is None:
-        return (chunk_min, chunk_max)
-    else:
-        (min_x, min_y, min_z), (max_x, max_y, max_z) = current_bbox
-        min_x = min(min_x, chunk_min[0])
-        min_y = min(min_y, chunk_min[1])
-        min_z = min(min_z, chunk_min[2])
-        max_x = max(max_x, chunk_max[0])
-        max_y = max(max_y, chunk_max[1])
-        max_z = max(max_z, chunk_max[2])
-        return ((min_x, min_y, min_z), (max_x, max_y, max_z))
+
+    def __init__(self, path: str, header: laspy.LasHeader, capacity: int) -> None:
+        self._buffer = laspy.ScaleAwarePointRecord.zeros(capacity, header=header)
+        self._size = 0
+        self._writer = laspy.open(path, mode="w", header=header)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._flush()
+        finally:
+            self._writer.close()
+        return False  # propagate exceptions
+
+    def write_points(self, points) -> None:
+        array = points.array
+        capacity = len(self._buffer)
+        start = 0
+        while start < len(array):
+            if self._size == 0 and len(array) - start >= capacity:
+                # A full buffer's worth of points is written directly
+                self._writer.write_points(points[start:])
+                return
+            n = min(len(array) - start, capacity - self._size)
+            self._buffer.array[self._size:self._size + n] = array[start:start + n]
+            self._size += n
+            start += n
+            if self._size == capacity:
+                self._flush()
+
+    def _flush(self) -> None:
+        if self._size:
+            self._writer.write_points(self._buffer[:self._size])
+            self._size = 0
+
+
+def _open_output(path: Optional[str], header: laspy.LasHeader, buffer_points: int):
+    """Open an output point cloud, written through a buffer if requested.
+
+    A ``path`` of ``None`` returns a :class:`_NullWriter`.
+    """
+    if path is None:
+        return _NullWriter()
+    if buffer_points > 0:
+        return _BufferedWriter(path, header, buffer_points)
+    return laspy.open(path, mode="w", header=header)
+
+
+def _new_bbox() -> np.ndarray:
+    """Return an empty running bounding box.
+
+    The box is a ``(2, 3)`` array ``[[min_x, min_y, min_z], [max_x,
+    max_y, max_z]]`` initialised to ``+inf``/``-inf`` so that the first
+    :func:`_update_bbox` call replaces it.
+    """
+    bbox = np.empty((2, 3))
+    bbox[0] = np.inf
+    bbox[1] = -np.inf
+    return bbox
+
+
+def _update_bbox(bbox: np.ndarray, points: "laspy.ScaleAwarePointRecord") -> np.ndarray:
+    """Update a bounding box in place with the points from a chunk.
+
+    The extremes are taken over the raw integer ``X``/``Y``/``Z``
+    records, and only those six values are scaled, instead of creating
+    scaled float copies of every coordinate.
+
+    :param bbox: Running bounding box from :func:`_new_bbox`.
+    :param points: A point record as produced by ``chunk_iterator``.
+    :returns: ``bbox``, updated.
+    """
+    raw_min = np.array([points.X.min(), points.Y.min(), points.Z.min()], dtype=float)
+    raw_max = np.array([points.X.max(), points.Y.max(), points.Z.max()], dtype=float)
+    scales = points.scales
+    offsets = points.offsets
+    lo = raw_min * scales + offsets
+    hi = raw_max * scales + offsets
+    # A negative scale swaps the ends
+    np.minimum(bbox[0], np.minimum(lo, hi), out=bbox[0])
+    np.maximum(bbox[1], np.maximum(lo, hi), out=bbox[1])
+    return bbox
 
 
 def _file_size(path: str) -> Optional[int]:
@@ -17,7 +17,9 @@ a single measurement record, a list of tree records and a matching
 configuration.  It returns a tuple containing the resolved tree
 identifier (or ``None``), a ``match_status`` string and a
 ``candidate_tree_uid`` when the match is ambiguous.  See the
-SingleTree SPEC for more details on these fields.
+SingleTree SPEC for more details on these fields.  When many
+measurements are matched against the same trees, build a
+:class:`TreeIndex` once and pass it instead of the tree list.
 
 These utilities operate purely on Python data structures.  They do
 not perform any database operations; callers are responsible for
@@ -31,8 +33,17 @@ assist manual review.
 
 from __future__ import annotations
 
-import uuid
-from typing import Dict, Iterable, Optional, Tuple, List
+import math
+import os
+from operator import itemgetter
+from typing import Dict, Iterable, Optional, Tuple, List, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - handled at runtime
+    # numpy is only needed for :class:`TreeIndex`; plain lists of tree
+    # records are matched without it.
+    np = None  # type: ignore
 
 
 class MatchConfig:
@@ -63,17 +74,327 @@ def generate_temporary_tree_uid() -> str:
 
     Temporary tree identifiers are prefixed with ``temp_`` to
     distinguish them from permanent tree_uids, which typically
-    incorporate stand and tree numbering.  The UUID ensures global
-    uniqueness.
+    incorporate stand and tree numbering.  The 128 random bits (as
+    many as a UUID carries) ensure global uniqueness.
 
-    :returns: A string such as ``temp_d3b07384-d9a6-44b3-a5d3-...``.
+    :returns: A string such as ``temp_d3b07384d9a644b3a5d3...``.
     """
-    return f"temp_{uuid.uuid4()}"
+    return "temp_" + os.urandom(16).hex()
+
+
+# Integer codes of the species seen by :class:`TreeIndex`, shared by
+# all instances so that codes of different indexes agree
+_species_to_code: Dict[object, int] = {}
+
+
+def _species_code(species: object) -> int:
+    """Return the integer code of a species, or -1 if it is missing."""
+    if not species:
+        return -1
+    code = _species_to_code.get(species)
+    if code is None:
+        code = _species_to_code[species] = len(_species_to_code)
+    return code
+
+
+# Maximum number of (measurement, tree) cells per block in
+# :meth:`TreeIndex.match_batch`; each int16 matrix is 8 MiB at most
+_BATCH_CELLS = 4 * 1024 * 1024
+
+# Fixed-point scale of the int16 DBH and height values used by the
+# coarse pass of :meth:`TreeIndex.match_batch` (0.1 cm / 0.1 m), and the
+# largest magnitude quantized so that differences fit in an int16
+_QUANT_SCALE = 10.0
+_QUANT_MAX = 16383
+
+
+class TreeIndex:
+    """Columnar (structure-of-arrays) view of tree records for matching.
+
+    Matching a measurement against a plain list of tree dictionaries
+    visits every record in Python.  A ``TreeIndex`` extracts the
+    attributes used for matching into NumPy arrays once, so that each
+    measurement is matched with a handful of vectorised operations.
+    Build it once and pass it in place of the tree list to
+    :func:`match_measurement_to_tree` or :func:`assign_measurement`.
+
+    As in the list-based matcher, a missing DBH or height (on either
+    side) gives an infinite difference.
+
+    :param trees: Iterable of tree records with keys ``tree_uid``,
+        ``dbh_cm``, ``height_m``, ``species_code`` and
+        ``is_temporary``.
+    """
+
+    def __init__(self, trees: Iterable[Dict[str, object]]) -> None:
+        if np is None:
+            raise ImportError("numpy must be installed to use TreeIndex")
+        trees = list(trees)
+        dbh, dbh_missing = self._float_column(trees, "dbh_cm")
+        # Trees are kept sorted by DBH (missing values last) so that the
+        # candidates within the DBH tolerance form a contiguous slice.
+        # ``order`` holds the original positions for tie-breaking.
+        self.order = np.argsort(dbh, kind="stable")
+        self.dbh = dbh[self.order]
+        self.dbh_missing = dbh_missing[self.order] if dbh_missing is not None else None
+        height, height_missing = self._float_column(trees, "height_m")
+        self.height = height[self.order]
+        self.height_missing = height_missing[self.order] if height_missing is not None else None
+        self.uids = np.array([tree["tree_uid"] for tree in trees], dtype=object)[self.order]
+        # Species are dictionary-encoded as integer codes; trees without
+        # a species code get -1 and match any measured species
+        self.species_codes = np.array(
+            [_species_code(tree.get("species_code")) for tree in trees], dtype=np.int32
+        )[self.order]
+        self.is_temporary = np.array([bool(tree.get("is_temporary")) for tree in trees], dtype=bool)[
+            self.order
+        ]
+        # int16 fixed-point DBH and height, built on first batch match
+        self._dbh_q: Optional[Tuple["np.ndarray", Optional["np.ndarray"]]] = None
+        self._height_q: Optional[Tuple["np.ndarray", Optional["np.ndarray"]]] = None
+
+    @staticmethod
+    def _float_column(trees: List[Dict[str, object]], key: str) -> Tuple["np.ndarray", Optional["np.ndarray"]]:
+        # Returns the values (missing ones as inf) and a mask of the
+        # missing values, or None if there are none
+        values = [tree.get(key) for tree in trees]
+        missing = np.array([v is None for v in values], dtype=bool)
+        array = np.array([float("inf") if v is None else float(v) for v in values], dtype=np.float64)
+        return array, (missing if missing.any() else None)
+
+    @staticmethod
+    def _diff(values: "np.ndarray", missing: Optional["np.ndarray"], target: Optional[object]) -> "np.ndarray":
+        if target is None:
+            return np.full(len(values), np.inf)
+        diff = np.abs(values - float(target))
+        if missing is not None:
+            # inf - NaN would be NaN; keep missing tree values infinite
+            diff[missing] = np.inf
+        return diff
+
+    def _dbh_band(self, m_dbh: Optional[object], tolerance: float) -> slice:
+        """Return the slice of trees whose DBH may be within tolerance."""
+        if m_dbh is None:
+            return slice(0, len(self.dbh))
+        m_dbh = float(m_dbh)
+        if m_dbh != m_dbh:
+            # NaN: only missing tree values (infinite differences) can
+            # match, with an infinite tolerance
+            return slice(0, len(self.dbh))
+        # Widen the band by a few ulps so that rounding in m_dbh +/- tol
+        # never drops a tree that passes the exact test below
+        slack = 4 * np.finfo(np.float64).eps * (abs(m_dbh) + tolerance)
+        lo = np.searchsorted(self.dbh, m_dbh - tolerance - slack, side="left")
+        hi = np.searchsorted(self.dbh, m_dbh + tolerance + slack, side="right")
+        return slice(int(lo), int(hi))
+
+    def __len__(self) -> int:
+        return len(self.uids)
+
+    def match(
+        self,
+        measurement: Dict[str, object],
+        config: MatchConfig,
+    ) -> Tuple[Optional[str], str, Optional[str]]:
+        """Match one measurement; see :func:`match_measurement_to_tree`.
+
+        Only the trees in the DBH band found by binary search on the
+        sorted DBH column are examined.
+        """
+        m_dbh = measurement.get("dbh_cm")
+        m_height = measurement.get("height_m")
+        m_species = measurement.get("species_code")
+        band = self._dbh_band(m_dbh, config.dbh_tolerance)
+        dbh_missing = self.dbh_missing[band] if self.dbh_missing is not None else None
+        height_missing = self.height_missing[band] if self.height_missing is not None else None
+        dbh_diff = self._diff(self.dbh[band], dbh_missing, m_dbh)
+        height_diff = self._diff(self.height[band], height_missing, m_height)
+        mask = ~self.is_temporary[band]
+        mask &= dbh_diff <= config.dbh_tolerance
+        mask &= height_diff <= config.height_tolerance
+        if config.species_must_match and m_species:
+            # A species no tree has gets -2, which only matches trees
+            # without a species
+            m_code = _species_to_code.get(m_species, -2)
+            codes = self.species_codes[band]
+            mask &= (codes == m_code) | (codes < 0)
+        idx = np.flatnonzero(mask)
+
+        uids = self.uids[band]
+        if idx.size == 1:
+            return uids[idx[0]], "auto", None
+        if idx.size == 0:
+            return None, "unmatched", None
+        # Multiple candidates: the best has the smallest DBH and then
+        # height difference, with ties going to the earlier tree
+        best = idx[np.lexsort((self.order[band][idx], height_diff[idx], dbh_diff[idx]))[0]]
+        return None, "unmatched", uids[best]
+
+    def match_batch(
+        self,
+        measurements: List[Dict[str, object]],
+        config: MatchConfig,
+    ) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """Match many measurements at once.
+
+        A block of measurements is compared with all trees as
+        ``(block, trees)`` matrices by broadcasting.  This coarse pass
+        uses DBH and height quantized to int16 fixed point (see
+        :data:`_QUANT_SCALE`), with tolerances widened by the rounding
+        error; only the surviving pairs are compared exactly.  Blocks
+        are sized to at most :data:`_BATCH_CELLS` cells to bound memory
+        use.  The decisions are the same as those of :meth:`match` for
+        each measurement.
+
+        :param measurements: Measurement records with keys ``dbh_cm``,
+            ``height_m`` and ``species_code``.
+        :param config: Matching configuration.
+        :returns: Object arrays ``(tree_uids, match_statuses,
+            candidate_tree_uids)`` with one entry per measurement.
+        """
+        n_meas = len(measurements)
+        tree_uids = np.full(n_meas, None, dtype=object)
+        statuses = np.full(n_meas, "unmatched", dtype=object)
+        candidate_uids = np.full(n_meas, None, dtype=object)
+        n_trees = len(self)
+        if n_trees == 0 or n_meas == 0:
+            return tree_uids, statuses, candidate_uids
+
+        m_dbh, m_dbh_missing = self._float_column(measurements, "dbh_cm")
+        m_height, m_height_missing = self._float_column(measurements, "height_m")
+        m_dbh_q, m_dbh_exact = _quantize(m_dbh)
+        m_height_q, m_height_exact = _quantize(m_height)
+        if self._dbh_q is None:
+            self._dbh_q = _quantize(self.dbh)
+            self._height_q = _quantize(self.height)
+        dbh_tol_q = _quantized_tolerance(config.dbh_tolerance)
+        height_tol_q = _quantized_tolerance(config.height_tolerance)
+        check_species = config.species_must_match
+        if check_species:
+            # -2 for species no tree has (never equal to a tree code),
+            # -3 for measurements without a species (no check)
+            m_codes = np.array(
+                [_species_to_code.get(m["species_code"], -2) if m.get("species_code") else -3 for m in measurements],
+                dtype=np.int32,
+            )
+            tree_unknown = self.species_codes < 0
+        not_temporary = ~self.is_temporary
+        block = max(1, _BATCH_CELLS // n_trees)
+
+        for start in range(0, n_meas, block):
+            stop = min(start + block, n_meas)
+            # Coarse pass on the (block, trees) matrices: quantized
+            # differences with the tolerance widened by the rounding
+            # error, so no true match is dropped
+            valid = np.broadcast_to(not_temporary, (stop - start, n_trees)).copy()
+            if check_species:
+                codes = m_codes[start:stop, None]
+                valid &= (self.species_codes == codes) | tree_unknown | (codes == -3)
+            if dbh_tol_q is not None:
+                valid &= _coarse_within(m_dbh_q, m_dbh_exact, start, stop, self._dbh_q, dbh_tol_q)
+            if height_tol_q is not None:
+                valid &= _coarse_within(m_height_q, m_height_exact, start, stop, self._height_q, height_tol_q)
+
+            # Exact pass on the surviving (measurement, tree) pairs
+            rows, cols = np.nonzero(valid)
+            dbh_diff = self._pair_diff(m_dbh, m_dbh_missing, rows + start, self.dbh, self.dbh_missing, cols)
+            height_diff = self._pair_diff(
+                m_height, m_height_missing, rows + start, self.height, self.height_missing, cols
+            )
+            ok = (dbh_diff <= config.dbh_tolerance) & (height_diff <= config.height_tolerance)
+            rows, cols, dbh_diff, height_diff = rows[ok], cols[ok], dbh_diff[ok], height_diff[ok]
+            counts = np.bincount(rows, minlength=stop - start)
+
+            # Best candidate per row: smallest DBH difference, then
+            # height difference, then original tree position
+            best_uids = np.full(stop - start, None, dtype=object)
+            if rows.size:
+                ranked = np.lexsort((self.order[cols], height_diff, dbh_diff, rows))
+                rows, cols = rows[ranked], cols[ranked]
+                first = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+                best_uids[rows[first]] = self.uids[cols[first]]
+
+            single = counts == 1
+            many = counts > 1
+            tree_uids[start:stop][single] = best_uids[single]
+            statuses[start:stop][single] = "auto"
+            candidate_uids[start:stop][many] = best_uids[many]
+
+        return tree_uids, statuses, candidate_uids
+
+    @staticmethod
+    def _pair_diff(
+        targets: "np.ndarray",
+        targets_missing: Optional["np.ndarray"],
+        rows: "np.ndarray",
+        values: "np.ndarray",
+        values_missing: Optional["np.ndarray"],
+        cols: "np.ndarray",
+    ) -> "np.ndarray":
+        # Absolute differences between targets[rows] and values[cols],
+        # infinite where either side is missing
+        with np.errstate(invalid="ignore"):
+            diff = np.abs(targets[rows] - values[cols])
+        if targets_missing is not None:
+            diff[targets_missing[rows]] = np.inf
+        if values_missing is not None:
+            diff[values_missing[cols]] = np.inf
+        return diff
+
+
+def _quantize(values: "np.ndarray") -> Tuple["np.ndarray", Optional["np.ndarray"]]:
+    """Quantize DBH or height values to int16 fixed point.
+
+    :param values: Float values (missing ones as inf).
+    :returns: ``(quantized, exact_only)`` where ``quantized`` holds the
+        values in units of ``1 / _QUANT_SCALE`` and ``exact_only`` masks
+        the values that are missing, NaN or outside ``+/- _QUANT_MAX``
+        and therefore skip the coarse test (``None`` if there are none).
+    """
+    with np.errstate(invalid="ignore"):
+        scaled = values * _QUANT_SCALE
+        in_range = np.abs(scaled) <= _QUANT_MAX
+    quantized = np.rint(np.where(in_range, scaled, 0.0)).astype(np.int16)
+    return quantized, (None if in_range.all() else ~in_range)
+
+
+def _quantized_tolerance(tolerance: float) -> Optional["np.int16"]:
+    """Return the coarse int16 tolerance, or ``None`` to skip the coarse test.
+
+    Rounding each side to the nearest quantum moves a difference by at
+    most one quantum; one more absorbs floating point error in the
+    scaling.
+    """
+    scaled = float(tolerance) * _QUANT_SCALE
+    if not scaled + 2 <= _QUANT_MAX:
+        # Infinite, NaN or too wide to be worth a coarse test
+        return None
+    return np.int16(max(math.ceil(scaled) + 2, -1))
+
+
+def _coarse_within(
+    targets_q: "np.ndarray",
+    targets_exact: Optional["np.ndarray"],
+    start: int,
+    stop: int,
+    values_q: Tuple["np.ndarray", Optional["np.ndarray"]],
+    tolerance_q: "np.int16",
+) -> "np.ndarray":
+    """Coarse ``(block, trees)`` tolerance mask on quantized values."""
+    values, values_exact = values_q
+    # Both sides are within +/- _QUANT_MAX, so the int16 difference
+    # cannot overflow
+    within = np.abs(targets_q[start:stop, None] - values[None, :]) <= tolerance_q
+    if targets_exact is not None:
+        within |= targets_exact[start:stop, None]
+    if values_exact is not None:
+        within |= values_exact[None, :]
+    return within
 
 
 def match_measurement_to_tree(
     measurement: Dict[str, object],
-    trees: Iterable[Dict[str, object]],
+    trees: Union[TreeIndex, Iterable[Dict[str, object]]],
     config: MatchConfig,
 ) -> Tuple[Optional[str], str, Optional[str]]:
     """Determine how a measurement should be linked to a tree.
@@ -98,24 +419,40 @@ def match_measurement_to_tree(
 
     :param measurement: A measurement record with keys ``dbh_cm``,
         ``height_m`` and ``species_code``.  Values may be ``None``.
-    :param trees: An iterable of tree records with the same keys.
+    :param trees: An iterable of tree records with the same keys, or a
+        :class:`TreeIndex` built from them for vectorised matching.
     :param config: Matching configuration specifying tolerances and
         species matching behaviour.
     :returns: Tuple ``(tree_uid, match_status, candidate_tree_uid)``.
     """
 
+    if isinstance(trees, TreeIndex):
+        return trees.match(measurement, config)
+
     # Extract measurement attributes, defaulting to None
     m_dbh = measurement.get("dbh_cm")
     m_height = measurement.get("height_m")
     m_species = measurement.get("species_code")
 
+    # A missing value on either side counts as an infinite difference,
+    # which only an infinite tolerance accepts; otherwise such trees
+    # are skipped outright
+    inf = float("inf")
+    dbh_required = config.dbh_tolerance != inf
+    height_required = config.height_tolerance != inf
+    if (m_dbh is None and dbh_required) or (m_height is None and height_required):
+        return None, "unmatched", None
+    if m_dbh is not None:
+        m_dbh = float(m_dbh)
+    if m_height is not None:
+        m_height = float(m_height)
+
     candidates: List[Tuple[str, float, float]] = []  # (tree_uid, dbh_diff, height_diff)
 
     for tree in trees:
         # Skip temporary trees when matching; they represent unresolved records
         if tree.get("is_temporary"):
             continue
-        t_uid = tree["tree_uid"]
         t_dbh = tree.get("dbh_cm")
         t_height = tree.get("height_m")
         t_species = tree.get("species_code")
@@ -124,20 +461,23 @@ def match_measurement_to_tree(
         if config.species_must_match and m_species and t_species and m_species != t_species:
             continue
 
-        # Compute differences; if either value is missing, use a large difference
-        if m_dbh is not None and t_dbh is not None:
-            dbh_diff = abs(float(m_dbh) - float(t_dbh))
+        if m_dbh is None or t_dbh is None:
+            if dbh_required:
+                continue
+            dbh_diff = inf
         else:
-            dbh_diff = float("inf")
+            dbh_diff = abs(m_dbh - float(t_dbh))
 
-        if m_height is not None and t_height is not None:
-            height_diff = abs(float(m_height) - float(t_height))
+        if m_height is None or t_height is None:
+            if height_required:
+                continue
+            height_diff = inf
         else:
-            height_diff = float("inf")
+            height_diff = abs(m_height - float(t_height))
 
         # Candidate qualifies if differences are within tolerances
         if dbh_diff <= config.dbh_tolerance and height_diff <= config.height_tolerance:
-            candidates.append((t_uid, dbh_diff, height_diff))
+            candidates.append((tree["tree_uid"], dbh_diff, height_diff))
 
     if len(candidates) == 1:
         # Exactly one match: auto assign
@@ -147,15 +487,15 @@ def match_measurement_to_tree(
         return None, "unmatched", None
     else:
         # Multiple candidates: ambiguous
-        # Sort by DBH then height difference to find the best candidate
-        candidates.sort(key=lambda x: (x[1], x[2]))
-        best_candidate = candidates[0][0]
+        # Smallest DBH then height difference is the best candidate;
+        # min() keeps the first of equal candidates, like a stable sort
+        best_candidate = min(candidates, key=itemgetter(1, 2))[0]
         return None, "unmatched", best_candidate
 
 
 def assign_measurement(
     measurement: Dict[str, object],
-    trees: Iterable[Dict[str, object]],
+    trees: Union[TreeIndex, Iterable[Dict[str, object]]],
     config: Optional[MatchConfig] = None,
 ) -> Tuple[Dict[str, object], Optional[Dict[str, object]]]:
     """Assign a measurement to a tree, creating a temporary tree if needed.
@@ -173,7 +513,8 @@ def assign_measurement(
         and ``height_m`` fields for matching.  Any existing
         ``tree_uid``, ``match_status`` or ``candidate_tree_uid``
         values will be overwritten.
-    :param trees: Iterable of existing tree records.
+    :param trees: Iterable of existing tree records, or a
+        :class:`TreeIndex` built from them.
     :param config: Optional matching configuration.  Defaults to
         :class:`MatchConfig()`.
     :returns: Tuple ``(updated_measurement, temporary_tree)``.  The
@@ -186,9 +527,73 @@ def assign_measurement(
         config = MatchConfig()
 
     tree_uid, status, candidate_uid = match_measurement_to_tree(measurement, trees, config)
+    return _apply_match(measurement, tree_uid, status, candidate_uid)
 
-    temp_tree: Optional[Dict[str, object]] = None
 
+def assign_measurements_batch(
+    measurements: Iterable[Dict[str, object]],
+    trees: Union[TreeIndex, Iterable[Dict[str, object]]],
+    config: Optional[MatchConfig] = None,
+) -> Tuple[List[Dict[str, object]], List[Dict[str, object]]]:
+    """Assign many measurements to trees in one vectorised pass.
+
+    This is the batch form of :func:`assign_measurement`: all
+    measurements are matched with :meth:`TreeIndex.match_batch` and
+    then updated in the same way, creating a temporary tree for each
+    one that could not be assigned automatically.
+
+    :param measurements: Measurement records to assign.
+    :param trees: Iterable of existing tree records, or a
+        :class:`TreeIndex` built from them.
+    :param config: Optional matching configuration.  Defaults to
+        :class:`MatchConfig()`.
+    :returns: Tuple ``(updated_measurements, temporary_trees)``.
+    """
+    if config is None:
+        config = MatchConfig()
+    if not isinstance(trees, TreeIndex):
+        trees = TreeIndex(trees)
+    measurements = list(measurements)
+    tree_uids, statuses, candidate_uids = trees.match_batch(measurements, config)
+
+    updated: List[Dict[str, object]] = []
+    temp_trees: List[Dict[str, object]] = []
+    for measurement, tree_uid, status, candidate_uid in zip(
+        measurements, tree_uids.tolist(), statuses.tolist(), candidate_uids.tolist()
+    ):
+        measurement, temp_tree = _apply_match(measurement, tree_uid, status, candidate_uid)
+        updated.append(measurement)
+        if temp_tree is not None:
+            temp_trees.append(temp_tree)
+    return updated, temp_trees
+
+
+# Field layout and constant values of a temporary tree record; copied
+# and filled in from the measurement by _apply_match
+_TEMP_TREE_TEMPLATE: Dict[str, object] = {
+    "tree_uid": None,
+    "treeID": None,
+    "source": None,
+    "species_code": None,
+    "status": None,
+    "height_m": None,
+    "dbh_cm": None,
+    "crown_base_height_m": None,
+    "last_measurement_date": None,
+    "crs_epsg": None,
+    "geom": None,
+    "is_temporary": 1,
+}
+
+
+def _apply_match(
+    measurement: Dict[str, object],
+    tree_uid: Optional[str],
+    status: str,
+    candidate_uid: Optional[str],
+) -> Tuple[Dict[str, object], Optional[Dict[str, object]]]:
+    """Record a match result on a measurement, creating a temporary tree if needed."""
+    temp_tree: Optional[Dict[str, object]] = None
     if status == "auto" and tree_uid is not None:
         measurement["tree_uid"] = tree_uid
         measurement["match_status"] = "auto"
@@ -196,20 +601,13 @@ def assign_measurement(
     else:
         # Generate a temporary tree UID and record
         tmp_uid = generate_temporary_tree_uid()
-        temp_tree = {
-            "tree_uid": tmp_uid,
-            "treeID": None,
-            "source": None,
-            "species_code": measurement.get("species_code"),
-            "status": None,
-            "height_m": measurement.get("height_m"),
-            "dbh_cm": measurement.get("dbh_cm"),
-            "crown_base_height_m": measurement.get("crown_base_height_m"),
-            "last_measurement_date": measurement.get("measurement_date"),
-            "crs_epsg": None,
-            "geom": None,
-            "is_temporary": 1,
-        }
+        temp_tree = _TEMP_TREE_TEMPLATE.copy()
+        temp_tree["tree_uid"] = tmp_uid
+        temp_tree["species_code"] = measurement.get("species_code")
+        temp_tree["height_m"] = measurement.get("height_m")
+        temp_tree["dbh_cm"] = measurement.get("dbh_cm")
+        temp_tree["crown_base_height_m"] = measurement.get("crown_base_height_m")
+        temp_tree["last_measurement_date"] = measurement.get("measurement_date")
         measurement["tree_uid"] = tmp_uid
         measurement["match_status"] = "unmatched"
         measurement["candidate_tree_uid"] = candidate_uid
@@ -6,8 +6,18 @@ merging tree pack tiles into a single campaign cloud and performing
 operations such as downsampling or deduplication.
 """
 
-from . import merge  # noqa: F401
+import importlib
 
 __all__ = [
     "merge",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Submodules are imported on first access (PEP 562) so that importing
+    # the package does not pull in their heavy dependencies up front.
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
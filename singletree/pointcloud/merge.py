@@ -4,8 +4,9 @@ This module provides utilities to combine multiple tree pack and
 background point clouds (ground and residual) belonging to the same
 campaign into a single LAZ file.  The merged cloud maintains all
 point attributes, including instance IDs, semantic classes and
-optional confidence scores.  Merging is performed via streaming
-append using `laspy` to avoid loading entire clouds into memory.
+optional confidence scores.  Small campaigns are merged in a single
+pre-allocated buffer; larger ones are streamed chunk by chunk using
+`laspy` to avoid loading entire clouds into memory.
 
 Usage example::
 
@@ -26,8 +27,14 @@ into the ``assets`` table.
 
 from __future__ import annotations
 
+import multiprocessing
 import os
-from typing import List, Dict, Optional
+import queue
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional
 
 try:
     import numpy as np
@@ -36,6 +43,9 @@ except ImportError:
     np = None  # type: ignore
     laspy = None  # type: ignore
 
+# Marks the end of a prefetched stream
+_END = object()
+
 
 def merge_campaign_tree_packs(
     campaign_uid: str,
@@ -46,6 +56,11 @@ def merge_campaign_tree_packs(
     output_root: str = "pointclouds/campaigns",
     out_filename: Optional[str] = None,
     chunk_size: int = 1_000_000,
+    max_in_memory_points: int = 10_000_000,
+    use_laszip: bool = True,
+    use_cache: bool = False,
+    cache_dir: Optional[str] = None,
+    max_workers: Optional[int] = None,
 ) -> List[Dict[str, object]]:
     """Merge all tree pack tiles for a campaign into a single point cloud.
 
@@ -57,11 +72,14 @@ def merge_campaign_tree_packs(
     points.  Similarly, if ``include_residual`` is ``True``, all
     residual clouds (ending with ``_residual.laz``) are appended.
 
-    Merging is done in a streaming manner using `laspy` so that very
-    large campaigns can be handled without exhausting memory.  The
+    Campaigns up to ``max_in_memory_points`` points are copied into a
+    single pre-allocated point record and written once; larger
+    campaigns are streamed chunk by chunk using `laspy` so that they
+    can be handled without exhausting memory.  The
     merged point cloud inherits the point format, VLRs and coordinate
     system from the first tree pack file encountered.  All additional
-    files are assumed to have identical point formats and CRS.
+    files must have the same point format and are assumed to share its
+    CRS; points with other scales or offsets are rescaled.
 
     The merged file is stored under::
 
@@ -85,6 +103,26 @@ def merge_campaign_tree_packs(
         output (without directory).  If ``None``, the filename is
         derived from ``campaign_uid`` and the options.
     :param chunk_size: Number of points to read/write per chunk.
+    :param max_in_memory_points: Campaigns with at most this many
+        points in total are assembled in a single pre-allocated buffer
+        and written in one pass; larger campaigns are streamed chunk by
+        chunk.
+    :param use_laszip: If ``True`` and the ``laszip`` command line tool
+        is on the ``PATH``, tiles whose headers are identical (point
+        format, scales, offsets and VLRs) are merged by ``laszip
+        -merged`` instead of being decoded and re-encoded by `laspy`.
+    :param use_cache: If ``True``, the decoded point records of each
+        tile are kept in ``cache_dir`` as ``{tile}.laz.npy`` and
+        memory-mapped on later merges instead of decompressing the LAZ
+        file again.  Missing or outdated caches are built when needed.
+        Only applies when the merge is done with `laspy`.
+    :param cache_dir: Directory for the point caches.  Defaults to
+        ``{output_root}/{campaign_uid}/cache``.
+    :param max_workers: Number of worker processes used to build the
+        caches of several tiles at once.  ``None`` (the default) or
+        ``1`` builds them one after another in the calling process.
+        The workers are spawned, so scripts that use them must guard
+        their entry point with ``if __name__ == "__main__":``.
     :returns: A list containing a single asset record for the merged
         file.  Asset fields include ``asset_uid``, ``campaign_uid``,
         ``uri``, ``pc_role``, ``asset_type``, ``format``, ``crs_epsg``,
@@ -105,13 +143,19 @@ def merge_campaign_tree_packs(
     tree_files: List[str] = []
     ground_files: List[str] = []
     residual_files: List[str] = []
-    for fname in sorted(os.listdir(tiles_dir)):
-        if fname.endswith("_tree_pack.laz"):
-            tree_files.append(os.path.join(tiles_dir, fname))
-        elif include_ground and fname.endswith("_ground_only.laz"):
-            ground_files.append(os.path.join(tiles_dir, fname))
-        elif include_residual and fname.endswith("_residual.laz"):
-            residual_files.append(os.path.join(tiles_dir, fname))
+    by_suffix = {"_tree_pack.laz": tree_files}
+    if include_ground:
+        by_suffix["_ground_only.laz"] = ground_files
+    if include_residual:
+        by_suffix["_residual.laz"] = residual_files
+    with os.scandir(tiles_dir) as entries:
+        for entry in entries:
+            for suffix, files in by_suffix.items():
+                if entry.name.endswith(suffix):
+                    files.append(entry.path)
+                    break
+    for files in (tree_files, ground_files, residual_files):
+        files.sort()
 
     if not tree_files:
         raise ValueError(f"No tree pack files found in {tiles_dir}")
@@ -128,33 +172,57 @@ def merge_campaign_tree_packs(
         out_filename = f"{campaign_uid}_{suffix}.laz"
     merged_path = os.path.join(merged_dir, out_filename)
 
-    # Prepare the writer using the header from the first tree file
-    first_file = tree_files[0]
-    with laspy.open(first_file) as infile:
-        header = infile.header
-        crs_epsg = getattr(header, "epsg_code", None)
-        with laspy.open(merged_path, mode="w", header=header.copy()) as writer:
-            point_count = 0
-            bboxes = None
-
-            # Helper to append all points from a list of files
-            def append_files(files: List[str]) -> None:
-                nonlocal point_count, bboxes
-                for fpath in files:
-                    with laspy.open(fpath) as src:
-                        for points in src.chunk_iterator(chunk_size):
-                            writer.write_points(points)
-                            point_count += len(points)
-                            bboxes = _update_bbox(bboxes, points)
-
-            # Append tree points
-            append_files(tree_files)
-            # Append ground points if requested
-            if include_ground:
-                append_files(ground_files)
-            # Append residual points if requested
-            if include_residual:
-                append_files(residual_files)
+    # The merged cloud takes its header from the first tree file
+    input_files = tree_files + ground_files + residual_files
+    headers = [_read_header(fpath) for fpath in input_files]
+    header = headers[0]
+    crs_epsg = getattr(header, "epsg_code", None)
+    total_points = sum(h.point_count for h in headers)
+    point_count = 0
+
+    if use_laszip and _headers_compatible(headers) and _laszip_merge(input_files, merged_path):
+        # laszip merged the tiles without a laspy decode/encode round
+        # trip; take the point count from the header of the merged file.
+        point_count = _read_header(merged_path).point_count
+    else:
+        # Chunks are decompressed on a background thread so that reading
+        # the next chunk overlaps with handling the current one.
+        if use_cache:
+            if cache_dir is None:
+                cache_dir = os.path.join(output_root, campaign_uid, "cache")
+            caches = _build_point_caches(input_files, cache_dir, max_workers)
+            chunks = _prefetch(_iter_cached_chunks(caches, headers, chunk_size))
+        else:
+            chunks = _prefetch(_iter_chunks(input_files, chunk_size))
+        if total_points <= max_in_memory_points:
+            # Allocate the output record once and copy each chunk into its
+            # slice, then encode the whole cloud in a single write.
+            merged = laspy.LasData(
+                header=_output_header(header),
+                points=laspy.ScaleAwarePointRecord.zeros(total_points, header=header),
+            )
+            for points in chunks:
+                n = len(points)
+                # Assigning the raw records would silently cast between
+                # point layouts; refuse them as the streaming writer does
+                if points.array.dtype != merged.points.array.dtype:
+                    raise laspy.LaspyException("Incompatible point formats")
+                target = merged.points.array[point_count:point_count + n]
+                target[:] = points.array
+                if np.any(points.scales != header.scales) or np.any(points.offsets != header.offsets):
+                    # Re-express the coordinates in the output scaling
+                    view = laspy.ScaleAwarePointRecord(target, header.point_format, header.scales, header.offsets)
+                    view.x, view.y, view.z = points.x, points.y, points.z
+                point_count += n
+            if point_count < total_points:
+                merged.points = merged.points[:point_count]
+            merged.write(merged_path)
+        else:
+            # Stream chunks straight into the output file
+            with laspy.open(merged_path, mode="w", header=_output_header(header)) as writer:
+                for points in chunks:
+                    writer.write_points(points)
+                    point_count += len(points)
 
     # Prepare asset metadata
     asset_uid = f"pc_{campaign_uid}_merged"
@@ -183,28 +251,193 @@ def merge_campaign_tree_packs(
     return [asset_record]
 
 
-def _update_bbox(current_bbox, points: laspy.LasData):
-    """Update a bounding box with points from a chunk.
+def _iter_chunks(files: List[str], chunk_size: int) -> Iterator[laspy.ScaleAwarePointRecord]:
+    """Yield point chunks from each file in turn."""
+    for fpath in files:
+        with laspy.open(fpath) as src:
+            for points in src.chunk_iterator(chunk_size):
+                yield points
+
+
+def _cache_path(path: str, cache_dir: str) -> str:
+    """Return the path of the decoded point cache for a tile."""
+    return os.path.join(cache_dir, os.path.basename(path) + ".npy")
+
+
+def _cache_is_fresh(path: str, cache: str) -> bool:
+    """Check whether a tile has a cache at least as new as the tile."""
+    try:
+        return os.stat(cache).st_mtime_ns >= os.stat(path).st_mtime_ns
+    except OSError:
+        return False
+
+
+def _build_point_cache(path: str, cache: str) -> None:
+    """Decode a LAS/LAZ file once and store its raw point records."""
+    tmp = cache + ".tmp"
+    with open(tmp, "wb") as f:
+        np.save(f, laspy.read(path).points.array)
+    os.replace(tmp, cache)
+
+
+def _build_point_caches(files: List[str], cache_dir: str, max_workers: Optional[int] = None) -> List[str]:
+    """Build missing or outdated point caches.
 
-    If ``current_bbox`` is ``None``, returns a new bbox.  Otherwise
-    returns the expanded bbox covering both the existing bbox and the
-    new points.
+    The caches are built sequentially unless ``max_workers`` is greater
+    than one, in which case up to that many tiles are decoded at once in
+    worker processes.
+
+    :returns: The cache paths of ``files``, in the same order.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    caches = [_cache_path(fpath, cache_dir) for fpath in files]
+    stale = [(fpath, cache) for fpath, cache in zip(files, caches) if not _cache_is_fresh(fpath, cache)]
+    if max_workers is None or max_workers <= 1 or len(stale) <= 1:
+        for fpath, cache in stale:
+            _build_point_cache(fpath, cache)
+    else:
+        # Spawn the workers: a forked child can deadlock in the LAZ
+        # backend if the parent has already decoded LAZ data
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(len(stale), max_workers), mp_context=context) as ex:
+            list(ex.map(_build_point_cache, *zip(*stale)))
+    return caches
+
+
+def _iter_cached_chunks(
+    caches: List[str], headers: List[laspy.LasHeader], chunk_size: int
+) -> Iterator[laspy.ScaleAwarePointRecord]:
+    """Yield point chunks from the memory-mapped caches of each file."""
+    for cache, header in zip(caches, headers):
+        array = np.load(cache, mmap_mode="r")
+        for start in range(0, len(array), chunk_size):
+            yield laspy.ScaleAwarePointRecord(
+                array[start:start + chunk_size], header.point_format, header.scales, header.offsets
+            )
+
+
+def _prefetch(iterable: Iterable, maxsize: int = 2) -> Iterator:
+    """Iterate over ``iterable`` on a background thread.
+
+    Items are handed over through a bounded queue holding at most
+    ``maxsize`` items, so the producer runs ahead of the consumer by
+    that many items.  laspy releases the GIL while decompressing LAZ
+    data, which lets reading overlap with the caller's work.
+    Exceptions raised by the producer are re-raised in the consumer.
+    """
+    q: queue.Queue = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except BaseException as exc:  # handed to the consumer
+            put((_END, exc))
+            return
+        finally:
+            close = getattr(iterable, "close", None)
+            if close is not None:
+                close()
+        put((_END, None))
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, exc = q.get()
+            if item is _END:
+                if exc is not None:
+                    raise exc
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _read_header(path: str) -> laspy.LasHeader:
+    """Return the header of a LAS/LAZ file without reading its points."""
+    with laspy.open(path) as src:
+        return src.header
+
+
+# VLRs that legitimately differ between otherwise compatible tiles:
+# the ExtraBytes description (it carries per-file statistics; the
+# dimension layout itself is compared via the point format) and the
+# laszip compression record.
+_TILE_SPECIFIC_VLRS = {("LASF_Spec", 4), ("laszip encoded", 22204)}
+
+
+def _output_header(header: laspy.LasHeader) -> laspy.LasHeader:
+    """Return a fresh header for the merged file based on ``header``.
+
+    Only the fields that describe how points are encoded (point
+    format, scales, offsets, global encoding) and the VLRs are carried
+    over.  Unlike ``header.copy()`` this avoids deep-copying the VLRs,
+    which can be large (e.g. WKT CRS records); the output gets its own
+    VLR list holding references to the same records.
     """
-    xs = points.x
-    ys = points.y
-    zs = points.z
-    chunk_min = (float(xs.min()), float(ys.min()), float(zs.min()))
-    chunk_max = (float(xs.max()), float(ys.max()), float(zs.max()))
-    if current_bbox is None:
-        return (chunk_min, chunk_max)
-    (min_x, min_y, min_z), (max_x, max_y, max_z) = current_bbox
-    min_x = min(min_x, chunk_min[0])
-    min_y = min(min_y, chunk_min[1])
-    min_z = min(min_z, chunk_min[2])
-    max_x = max(max_x, chunk_max[0])
-    max_y = max(max_y, chunk_max[1])
-    max_z = max(max_z, chunk_max[2])
-    return ((min_x, min_y, min_z), (max_x, max_y, max_z))
+    out = laspy.LasHeader(point_format=header.point_format, version=header.version)
+    out.scales = header.scales
+    out.offsets = header.offsets
+    out.global_encoding = header.global_encoding
+    out.file_source_id = header.file_source_id
+    out.vlrs = list(header.vlrs)
+    return out
+
+
+def _header_key(header: laspy.LasHeader) -> tuple:
+    """Return the header fields that must agree for a raw merge."""
+    return (
+        str(header.version),
+        header.point_format.id,
+        tuple((dim.name, str(dim.dtype)) for dim in header.point_format.dimensions),
+        tuple(header.scales),
+        tuple(header.offsets),
+        tuple(
+            (vlr.user_id, vlr.record_id, bytes(vlr.record_data_bytes()))
+            for vlr in header.vlrs
+            if (vlr.user_id, vlr.record_id) not in _TILE_SPECIFIC_VLRS
+        ),
+    )
+
+
+def _headers_compatible(headers: List[laspy.LasHeader]) -> bool:
+    """Check whether all headers describe identically encoded points."""
+    first = _header_key(headers[0])
+    return all(_header_key(h) == first for h in headers[1:])
+
+
+def _laszip_merge(files: List[str], out_path: str) -> bool:
+    """Merge LAZ files with the ``laszip`` command line tool.
+
+    :returns: ``True`` if the merged file was written, ``False`` if
+        ``laszip`` is not installed or failed (in which case the
+        caller should fall back to merging with `laspy`).
+    """
+    exe = shutil.which("laszip")
+    if exe is None:
+        return False
+    try:
+        subprocess.run(
+            [exe, "-i", *files, "-merged", "-o", out_path],
+            check=True,
+            capture_output=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return os.path.isfile(out_path)
 
 
 def _file_size(path: str) -> Optional[int]:
@@ -1,8 +1,8 @@
 """Query utilities for the SingleTree dataset.
 
 This module provides helper functions to query trees by spatial
-criteria.  Because SingleTree stores tree points as WKB geometries
-within a GeoPackage, these helpers open the underlying SQLite
+criteria.  Because SingleTree stores tree points as GeoPackage (or
+raw WKB) geometry blobs, these helpers open the underlying SQLite
 database, decode the point coordinates from the geometry blob and
 apply simple spatial tests.  Two common operations are supported:
 
@@ -13,8 +13,8 @@ apply simple spatial tests.  Two common operations are supported:
 The functions return a list of dictionaries representing tree records
 matching the spatial criteria.  Geometry parsing is minimalistic and
 does not depend on external GIS libraries; the first two coordinates
-(x, y) are extracted from the WKB Point regardless of the presence of
-additional dimensions (Z or M).
+(x, y) are extracted from the WKB Point, after any GeoPackage
+header, regardless of the presence of additional dimensions (Z or M).
 
 **Note:** These helpers assume that the polygon and bounding box
 coordinates are expressed in the same coordinate reference system
@@ -24,66 +24,490 @@ coordinates are expressed in the same coordinate reference system
 
 from __future__ import annotations
 
+import os
 import sqlite3
 import struct
-from typing import Iterable, List, Tuple, Dict, Optional
+from typing import TYPE_CHECKING, Iterable, List, Sequence, Tuple, Dict, Optional, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Attribute columns returned for each tree record, in the order they are
+# selected; the coordinates decoded from ``geom`` are inserted before
+# ``is_temporary``
+_TREE_COLUMNS = (
+    "tree_uid",
+    "treeID",
+    "source",
+    "species_code",
+    "status",
+    "height_m",
+    "dbh_cm",
+    "crown_base_height_m",
+    "last_measurement_date",
+    "crs_epsg",
+    "is_temporary",
+)
+
+# X and Y doubles of a WKB Point in either byte order
+_XY_LE = struct.Struct("<dd")
+_XY_BE = struct.Struct(">dd")
+
+# GeoPackage binary header: "GP" magic, version, flags, SRS id, then an
+# envelope whose size in bytes is given by bits 1-3 of the flags byte
+# (none, XY, XYZ, XYM, XYZM); bit 4 marks an empty geometry
+_ENVELOPE_SIZES = (0, 32, 48, 48, 64)
+_GP_EMPTY = 0b10000
+
+# Rows fetched from SQLite per batch while scanning candidates
+_FETCH_SIZE = 10000
+
+# Row ids bound per ``rowid IN (...)`` lookup, below the 999 host
+# parameter limit of SQLite releases before 3.32
+_ROWID_BATCH = 900
+
+# Maximum number of (point, edge) cells per block in PolygonIndex.contains
+_PIP_CELLS = 4 * 1024 * 1024
+
+# Read tuning applied to query connections: memory-map up to 256 MiB of
+# the database file and allow a 64 MiB page cache
+_MMAP_SIZE = 256 * 1024 * 1024
+_CACHE_SIZE_KIB = 64 * 1024
+
+
+def _wkb_offset(blob: bytes) -> Optional[int]:
+    """Return the offset of the WKB geometry within a geometry blob.
+
+    Blobs written by GeoPackage tools start with a ``GP`` header whose
+    length follows from the envelope indicator in the flags byte;
+    blobs without that magic are taken as raw WKB.
+
+    :param blob: Geometry blob from the ``geom`` column.
+    :returns: Offset of the WKB, or ``None`` for an empty geometry or
+        an invalid envelope indicator.
+    """
+    if blob[:2] != b"GP":
+        return 0
+    if len(blob) < 8:
+        return None
+    flags = blob[3]
+    envelope = (flags >> 1) & 0b111
+    if flags & _GP_EMPTY or envelope >= len(_ENVELOPE_SIZES):
+        return None
+    return 8 + _ENVELOPE_SIZES[envelope]
 
 
 def _parse_point_geom(blob: bytes) -> Optional[Tuple[float, float]]:
     """Extract the X and Y coordinates from a WKB Point geometry.
 
     The GeoPackage stores geometries as WKB (well‑known binary)
-    blobs.  This helper reads the first two doubles after the byte
-    order and geometry type.  It supports both little and big
-    endian encodings.  Additional dimensions (Z or M) are ignored.
+    blobs, normally behind a ``GP`` header which is skipped (see
+    :func:`_wkb_offset`).  This helper reads the first two doubles
+    after the byte order and geometry type.  It supports both little
+    and big endian encodings.  Additional dimensions (Z or M) are
+    ignored.
 
-    :param blob: WKB geometry blob from the ``geom`` column.
+    :param blob: GeoPackage or raw WKB geometry blob from the ``geom``
+        column.
     :returns: ``(x, y)`` or ``None`` if the blob is missing or
         malformed.
     """
-    if not blob or len(blob) < 21:
+    if not blob:
+        return None
+    offset = _wkb_offset(blob)
+    if offset is None or len(blob) < offset + 21:
         return None
     # Determine byte order: 0 = big endian, 1 = little endian
-    byte_order_flag = blob[0]
-    byte_order = "<" if byte_order_flag == 1 else ">"
+    xy = _XY_LE if blob[offset] == 1 else _XY_BE
     try:
         # Skip the endianness byte and geometry type (4 bytes)
         # Read two doubles (8 bytes each) for X and Y
-        x = struct.unpack(f"{byte_order}d", blob[5:13])[0]
-        y = struct.unpack(f"{byte_order}d", blob[13:21])[0]
-        return (x, y)
+        return xy.unpack_from(blob, offset + 5)
     except Exception:
         return None
 
 
-def _point_in_polygon(x: float, y: float, polygon: Iterable[Tuple[float, float]]) -> bool:
-    """Check whether a point lies inside a polygon using the ray casting algorithm.
+def _parse_point_geoms(blobs: Sequence[Optional[bytes]]) -> np.ndarray:
+    """Extract the X and Y coordinates from many WKB Point geometries.
+
+    Little endian blobs, the usual encoding in a GeoPackage, have
+    their coordinate bytes concatenated and decoded in a single
+    :func:`numpy.frombuffer` call.  Other blobs fall back to
+    :func:`_parse_point_geom`.
+
+    :param blobs: GeoPackage or raw WKB geometry blobs from the
+        ``geom`` column.
+    :returns: Array of shape ``(len(blobs), 2)`` holding ``(x, y)``
+        per blob; rows for missing or malformed blobs are NaN.
+    """
+    import numpy as np
+
+    coords = np.full((len(blobs), 2), np.nan)
+    fast_rows: List[int] = []
+    slices: List[bytes] = []
+    for i, blob in enumerate(blobs):
+        if not blob:
+            continue
+        offset = _wkb_offset(blob)
+        if offset is None:
+            continue
+        if len(blob) >= offset + 21 and blob[offset] == 1:
+            fast_rows.append(i)
+            slices.append(blob[offset + 5:offset + 21])
+        else:
+            pt = _parse_point_geom(blob)
+            if pt is not None:
+                coords[i] = pt
+    if slices:
+        coords[fast_rows] = np.frombuffer(b"".join(slices), dtype="<f8").reshape(-1, 2)
+    return coords
+
+
+# Compiled PolygonIndex.contains kernel: None until first requested,
+# False when Numba is not installed
+_PIP_BATCH = None
+
+
+def _pip_batch():
+    """Return the Numba-compiled form of :meth:`PolygonIndex.contains`.
+
+    Numba is imported and the kernel compiled on the first call (from
+    the on-disk cache when available); later calls reuse the kernel.
 
-    :param x: X coordinate of the point.
-    :param y: Y coordinate of the point.
-    :param polygon: Iterable of (x, y) tuples representing the polygon
-        vertices.  The polygon can be open or closed; the algorithm
-        treats the last and first points as connected.
-    :returns: True if the point is inside the polygon, False otherwise.
+    :returns: The compiled kernel, or ``None`` if Numba is not
+        installed.
     """
-    inside = False
-    if not polygon:
-        return False
-    pts = list(polygon)
-    n = len(pts)
-    for i in range(n):
-        xi, yi = pts[i]
-        xj, yj = pts[(i + 1) % n]
-        # Check if the point is on an edge; treat as inside
-        # Compute cross product to check collinearity
-        # But we ignore this for simplicity; collinear points are rare
-        # Ray casting: consider edges crossing the horizontal ray at y
-        intersects = ((yi > y) != (yj > y)) and (
-            x < (xj - xi) * (y - yi) / (yj - yi + 1e-12) + xi
-        )
-        if intersects:
-            inside = not inside
-    return inside
+    global _PIP_BATCH
+    if _PIP_BATCH is None:
+        try:
+            from numba import njit, prange
+        except ImportError:
+            _PIP_BATCH = False
+        else:
+            _PIP_BATCH = _compile_pip_batch(njit, prange)
+    return _PIP_BATCH or None
+
+
+def _compile_pip_batch(njit, prange):
+    """Compile the kernel returned by :func:`_pip_batch` with Numba."""
+    import numpy as np
+
+    @njit(parallel=True, cache=True)
+    def pip_batch(xs, ys, slab_ys, slab_start, slab_edges, edge_x, edge_y, edge_slope):
+        out = np.zeros(xs.size, np.bool_)
+        last_slab = slab_ys.size - 1
+        for i in prange(xs.size):
+            y = ys[i]
+            if not y == y:
+                continue
+            s = np.searchsorted(slab_ys, y, side="right") - 1
+            if s < 0 or s >= last_slab:
+                continue
+            x = xs[i]
+            inside = False
+            for k in range(slab_start[s], slab_start[s + 1]):
+                e = slab_edges[k]
+                if x < edge_slope[e] * (y - edge_y[e]) + edge_x[e]:
+                    inside = not inside
+            out[i] = inside
+        return out
+
+    return pip_batch
+
+
+# scipy.spatial.cKDTree: None until first requested, False when SciPy is
+# not installed
+_CKDTREE = None
+
+
+def _kdtree_class():
+    """Return :class:`scipy.spatial.cKDTree`, importing SciPy on first use.
+
+    :returns: The KD-tree class, or ``None`` if SciPy is not installed.
+    """
+    global _CKDTREE
+    if _CKDTREE is None:
+        try:
+            from scipy.spatial import cKDTree
+        except ImportError:
+            _CKDTREE = False
+        else:
+            _CKDTREE = cKDTree
+    return _CKDTREE or None
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """Open a GeoPackage for querying, with read tuning applied."""
+    conn = sqlite3.connect(db_path)
+    conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+    conn.execute(f"PRAGMA cache_size=-{_CACHE_SIZE_KIB}")
+    return conn
+
+
+class PolygonIndex:
+    """Polygon prepared for point-in-polygon tests of many points.
+
+    The edges are stored in a y-slab table: the distinct vertex y values
+    split the plane into horizontal slabs, and each slab lists the
+    edges spanning it.  A point only needs the edges of its slab, found
+    by binary search, which for large polygons is a small fraction of
+    all edges.  Horizontal edges never cross the ray and are dropped.
+    Build the index once to reuse it across queries.
+
+    :param polygon: Iterable of (x, y) coordinates defining the
+        polygon.  At least three points are required.  The polygon can
+        be open or closed; the last and first points are connected.
+    """
+
+    def __init__(self, polygon: Iterable[Tuple[float, float]]) -> None:
+        import numpy as np
+
+        vertices = np.asarray(list(polygon), dtype=np.float64)
+        if len(vertices) < 3:
+            raise ValueError("Polygon must have at least three vertices")
+        self.vertices = vertices
+        x0 = vertices[:, 0]
+        y0 = vertices[:, 1]
+        x1 = np.roll(x0, -1)
+        y1 = np.roll(y0, -1)
+        sloped = y1 != y0
+        # Edge start point and inverse slope, as used for the crossing
+        # test x < slope * (y - y0) + x0
+        self.edge_x = np.ascontiguousarray(x0[sloped])
+        self.edge_y = np.ascontiguousarray(y0[sloped])
+        self.edge_slope = (x1[sloped] - self.edge_x) / (y1[sloped] - self.edge_y)
+
+        # An edge crosses the ray at y if ymin <= y < ymax, which is
+        # exactly when it spans the slab slab_ys[s] <= y < slab_ys[s + 1]
+        edge_ymin = np.minimum(y0, y1)[sloped]
+        edge_ymax = np.maximum(y0, y1)[sloped]
+        self.slab_ys = np.unique(np.concatenate([edge_ymin, edge_ymax]))
+        first = np.searchsorted(self.slab_ys, edge_ymin)
+        spans = np.searchsorted(self.slab_ys, edge_ymax) - first
+        edges = np.repeat(np.arange(len(spans)), spans)
+        slabs = np.repeat(first - np.cumsum(spans) + spans, spans) + np.arange(len(edges))
+        by_slab = np.argsort(slabs, kind="stable")
+        self.slab_edges = edges[by_slab]
+        self.slab_start = np.zeros(max(len(self.slab_ys), 1), dtype=np.int64)
+        np.cumsum(np.bincount(slabs, minlength=len(self.slab_start) - 1), out=self.slab_start[1:])
+
+    @property
+    def bbox(self) -> Tuple[float, float, float, float]:
+        """Bounding box ``(xmin, ymin, xmax, ymax)`` of the vertices."""
+        xmin, ymin = self.vertices.min(axis=0).tolist()
+        xmax, ymax = self.vertices.max(axis=0).tolist()
+        return (xmin, ymin, xmax, ymax)
+
+    def contains(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Ray casting test of many points against the polygon.
+
+        Runs in parallel with Numba when it is installed.  Otherwise
+        the points are grouped by slab and each group is tested against
+        the slab's edges as one broadcast ``(points, edges)`` matrix,
+        in blocks of at most :data:`_PIP_CELLS` cells.
+
+        :param xs: X coordinates of the points, shape ``(N,)``.
+        :param ys: Y coordinates of the points, shape ``(N,)``.
+        :returns: Boolean array of shape ``(N,)``, True for points inside.
+        """
+        import numpy as np
+
+        xs = np.ascontiguousarray(xs, dtype=np.float64)
+        ys = np.ascontiguousarray(ys, dtype=np.float64)
+        pip_batch = _pip_batch()
+        if pip_batch is not None:
+            return pip_batch(
+                xs, ys, self.slab_ys, self.slab_start, self.slab_edges, self.edge_x, self.edge_y, self.edge_slope
+            )
+
+        inside = np.zeros(len(xs), dtype=bool)
+        slab = np.searchsorted(self.slab_ys, ys, side="right") - 1
+        # Points below the lowest or on/above the highest vertex (and
+        # NaN, sorted last) are in no slab
+        in_slab = np.flatnonzero((slab >= 0) & (slab < len(self.slab_ys) - 1))
+        points = in_slab[np.argsort(slab[in_slab], kind="stable")]
+        if not points.size:
+            return inside
+        point_slabs = slab[points]
+        bounds = np.flatnonzero(np.r_[True, point_slabs[1:] != point_slabs[:-1], True])
+        for lo, hi in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+            s = point_slabs[lo]
+            edges = self.slab_edges[self.slab_start[s]:self.slab_start[s + 1]]
+            ex = self.edge_x[edges]
+            ey = self.edge_y[edges]
+            slope = self.edge_slope[edges]
+            block = max(1, _PIP_CELLS // max(len(edges), 1))
+            for start in range(lo, hi, block):
+                idx = points[start:min(start + block, hi)]
+                y = ys[idx, None]
+                crosses = xs[idx, None] < slope * (y - ey) + ex
+                inside[idx] = np.logical_xor.reduce(crosses, axis=1)
+        return inside
+
+
+class TreeSpatialIndex:
+    """In-memory coordinates of all trees in a GeoPackage.
+
+    Decoding the point geometry of every tree is the bulk of a spatial
+    query, so the decoded coordinates are kept as NumPy arrays and
+    reused by later queries on the same database.  :meth:`load` caches
+    one index per database path and rebuilds it when the file (or its
+    write-ahead log) has been modified since.  Trees whose geometry is
+    missing or malformed are not included.
+
+    When SciPy is installed, bounding box queries are answered from a
+    KD-tree over the coordinates, built on first use, instead of a
+    scan over all trees.
+
+    :param rowids: SQLite row ids of the trees in ascending order,
+        shape ``(N,)``.
+    :param uids: Tree UIDs, object array of shape ``(N,)``.
+    :param xy: Tree coordinates, shape ``(N, 2)``.
+    """
+
+    def __init__(self, rowids: np.ndarray, uids: np.ndarray, xy: np.ndarray) -> None:
+        self.rowids = rowids
+        self.uids = uids
+        self.xy = xy
+        self.x = xy[:, 0]
+        self.y = xy[:, 1]
+        self._kdtree = None
+
+    @classmethod
+    def from_connection(cls, conn: sqlite3.Connection) -> "TreeSpatialIndex":
+        """Build an index by decoding the geometries of the ``trees`` table.
+
+        :param conn: Open connection to the GeoPackage.
+        :returns: A new :class:`TreeSpatialIndex`.
+        """
+        import numpy as np
+
+        cursor = conn.execute("SELECT rowid, tree_uid, geom FROM trees WHERE geom IS NOT NULL ORDER BY rowid")
+        rowids: List[np.ndarray] = []
+        uids: List[np.ndarray] = []
+        coords: List[np.ndarray] = []
+        while True:
+            rows = cursor.fetchmany(_FETCH_SIZE)
+            if not rows:
+                break
+            xy = _parse_point_geoms([row[2] for row in rows])
+            valid = ~np.isnan(xy).any(axis=1)
+            rowids.append(np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))[valid])
+            uids.append(np.array([row[1] for row in rows], dtype=object)[valid])
+            coords.append(xy[valid])
+        if not coords:
+            return cls(np.empty(0, dtype=np.int64), np.empty(0, dtype=object), np.empty((0, 2)))
+        return cls(np.concatenate(rowids), np.concatenate(uids), np.concatenate(coords))
+
+    @classmethod
+    def load(cls, db_path: str) -> "TreeSpatialIndex":
+        """Return the index for a GeoPackage, building it if needed.
+
+        :param db_path: Path to the GeoPackage (.gpkg) file.
+        :returns: The cached index when the database is unchanged since
+            it was built, otherwise a freshly built one.
+        """
+        path = os.path.abspath(db_path)
+        stamp = _file_stamp(path)
+        cached = _SPATIAL_INDEX_CACHE.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        conn = _connect(path)
+        try:
+            index = cls.from_connection(conn)
+        finally:
+            conn.close()
+        _SPATIAL_INDEX_CACHE[path] = (stamp, index)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.rowids)
+
+    def within_bbox(self, xmin: float, ymin: float, xmax: float, ymax: float) -> np.ndarray:
+        """Return the positions of the trees inside a bounding box.
+
+        :returns: Integer array of positions into :attr:`rowids`,
+            :attr:`uids` and :attr:`xy`, in row order.
+        """
+        import numpy as np
+
+        kdtree_class = _kdtree_class()
+        if kdtree_class is None or len(self) == 0 or not np.isfinite((xmin, ymin, xmax, ymax)).all():
+            x = self.x
+            y = self.y
+            return np.flatnonzero((x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax))
+        if xmin > xmax or ymin > ymax:
+            return np.empty(0, dtype=np.intp)
+        if self._kdtree is None:
+            self._kdtree = kdtree_class(self.xy)
+        # The box is the Chebyshev ball around its centre with the larger
+        # half extent as radius; pad it for rounding and trim the result
+        # to the exact box.
+        center = ((xmin + xmax) / 2.0, (ymin + ymax) / 2.0)
+        radius = max(xmax - xmin, ymax - ymin) / 2.0
+        radius += 4 * np.finfo(np.float64).eps * (max(abs(center[0]), abs(center[1])) + radius)
+        idx = np.asarray(self._kdtree.query_ball_point(center, r=radius, p=np.inf), dtype=np.intp)
+        idx.sort()
+        x = self.x[idx]
+        y = self.y[idx]
+        return idx[(x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)]
+
+
+# TreeSpatialIndex.load cache: absolute path -> (file stamp, index)
+_SPATIAL_INDEX_CACHE: Dict[str, Tuple[Tuple[Optional[int], ...], TreeSpatialIndex]] = {}
+
+
+def _file_stamp(path: str) -> Tuple[Optional[int], ...]:
+    # Modification times of the database and of its WAL file, which
+    # receives the writes of WAL-mode connections until a checkpoint
+    stamps: List[Optional[int]] = []
+    for name in (path, path + "-wal"):
+        try:
+            st = os.stat(name)
+        except FileNotFoundError:
+            stamps.extend((None, None))
+        else:
+            stamps.extend((st.st_mtime_ns, st.st_size))
+    return tuple(stamps)
+
+
+def _fetch_tree_records(db_path: str, index: TreeSpatialIndex, keep: np.ndarray) -> List[Dict[str, object]]:
+    """Load the tree records at the given positions of a spatial index.
+
+    Only the attribute columns of the selected rows are read from the
+    database; the coordinates come from the index.
+
+    :param db_path: Path to the GeoPackage (.gpkg) file.
+    :param index: Spatial index of the database.
+    :param keep: Ascending positions into ``index``.
+    :returns: Tree records including their parsed coordinates.
+    """
+    rowids: List[int] = index.rowids[keep].tolist()
+    points: List[List[float]] = index.xy[keep].tolist()
+
+    results: List[Dict[str, object]] = []
+    conn = _connect(db_path)
+    try:
+        # Row ids are ascending, so rows streamed from the cursor in
+        # rowid order line up with the cached coordinates; rows deleted
+        # since the index was built are simply skipped over.
+        select = f"SELECT rowid, {', '.join(_TREE_COLUMNS)} FROM trees WHERE rowid IN "
+        for start in range(0, len(rowids), _ROWID_BATCH):
+            batch = rowids[start:start + _ROWID_BATCH]
+            cursor = conn.execute(select + f"({', '.join('?' * len(batch))}) ORDER BY rowid", batch)
+            pos = start
+            for row in cursor:
+                while rowids[pos] != row[0]:
+                    pos += 1
+                x, y = points[pos]
+                record = dict(zip(_TREE_COLUMNS[:-1], row[1:-1]))
+                record["x"] = x
+                record["y"] = y
+                record["is_temporary"] = bool(row[-1])
+                results.append(record)
+    finally:
+        conn.close()
+    return results
 
 
 def query_trees_by_bbox(
@@ -95,6 +519,10 @@ def query_trees_by_bbox(
 ) -> List[Dict[str, object]]:
     """Return all tree records whose coordinates fall within a bounding box.
 
+    Coordinates are taken from the cached :class:`TreeSpatialIndex`
+    of the database, so repeated queries against an unchanged file do
+    not decode the geometries again.
+
     :param db_path: Path to the GeoPackage (.gpkg) file.
     :param xmin: Minimum X coordinate (left).
     :param ymin: Minimum Y coordinate (bottom).
@@ -103,60 +531,13 @@ def query_trees_by_bbox(
     :returns: List of dictionaries representing the matching tree
         records, including their parsed coordinates.
     """
-    results: List[Dict[str, object]] = []
-    conn = sqlite3.connect(db_path)
-    try:
-        cursor = conn.cursor()
-        # Retrieve relevant fields from the trees table
-        cursor.execute(
-            "SELECT tree_uid, treeID, source, species_code, status, height_m, dbh_cm, "
-            "crown_base_height_m, last_measurement_date, crs_epsg, geom, is_temporary "
-            "FROM trees"
-        )
-        for (
-            tree_uid,
-            treeID,
-            source,
-            species_code,
-            status,
-            height_m,
-            dbh_cm,
-            crown_base_height_m,
-            last_measurement_date,
-            crs_epsg,
-            geom,
-            is_temporary,
-        ) in cursor.fetchall():
-            pt = _parse_point_geom(geom)
-            if pt is None:
-                continue
-            x, y = pt
-            if (xmin <= x <= xmax) and (ymin <= y <= ymax):
-                results.append(
-                    {
-                        "tree_uid": tree_uid,
-                        "treeID": treeID,
-                        "source": source,
-                        "species_code": species_code,
-                        "status": status,
-                        "height_m": height_m,
-                        "dbh_cm": dbh_cm,
-                        "crown_base_height_m": crown_base_height_m,
-                        "last_measurement_date": last_measurement_date,
-                        "crs_epsg": crs_epsg,
-                        "x": x,
-                        "y": y,
-                        "is_temporary": bool(is_temporary),
-                    }
-                )
-    finally:
-        conn.close()
-    return results
+    index = TreeSpatialIndex.load(db_path)
+    return _fetch_tree_records(db_path, index, index.within_bbox(xmin, ymin, xmax, ymax))
 
 
 def query_trees_by_polygon(
     db_path: str,
-    polygon: Iterable[Tuple[float, float]],
+    polygon: Union[PolygonIndex, Iterable[Tuple[float, float]]],
     bounding_box: Optional[Tuple[float, float, float, float]] = None,
 ) -> List[Dict[str, object]]:
     """Return all tree records whose coordinates lie within a polygon.
@@ -169,31 +550,24 @@ def query_trees_by_polygon(
 
     :param db_path: Path to the GeoPackage (.gpkg) file.
     :param polygon: Iterable of (x, y) coordinates defining the
-        polygon.  At least three points are required.
+        polygon, or a :class:`PolygonIndex` built from them to reuse
+        across queries.  At least three points are required.
     :param bounding_box: Optional pre‑computed bounding box
         ``(xmin, ymin, xmax, ymax)`` for the polygon.  If not
         provided, it will be computed automatically.
     :returns: List of tree records inside the polygon, including
         their parsed coordinates.
     """
-    pts = list(polygon)
-    if len(pts) < 3:
-        raise ValueError("Polygon must have at least three vertices")
+    if not isinstance(polygon, PolygonIndex):
+        polygon = PolygonIndex(polygon)
     # Compute bounding box if not provided
-    if bounding_box is None:
-        xs = [p[0] for p in pts]
-        ys = [p[1] for p in pts]
-        bbox = (min(xs), min(ys), max(xs), max(ys))
-    else:
-        bbox = bounding_box
-    # First filter by bounding box
-    candidates = query_trees_by_bbox(db_path, *bbox)
-    # Then apply point‑in‑polygon test
-    inside: List[Dict[str, object]] = []
-    for rec in candidates:
-        if _point_in_polygon(rec["x"], rec["y"], pts):
-            inside.append(rec)
-    return inside
-
-
-__all__ = ["query_trees_by_bbox", "query_trees_by_polygon"]
\ No newline at end of file
+    bbox = polygon.bbox if bounding_box is None else bounding_box
+    # First filter by bounding box on the cached coordinates
+    index = TreeSpatialIndex.load(db_path)
+    keep = index.within_bbox(*bbox)
+    # Then apply point‑in‑polygon test to all candidates at once
+    inside = polygon.contains(index.x[keep], index.y[keep])
+    return _fetch_tree_records(db_path, index, keep[inside])
+
+
+__all__ = ["PolygonIndex", "TreeSpatialIndex", "query_trees_by_bbox", "query_trees_by_polygon"]
\ No newline at end of file
@@ -0,0 +1,164 @@
+"""Tests for the harvester (HPR) import helpers."""
+
+import math
+import os
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from singletree.ingest import harvester_hpr  # noqa: E402
+
+DATES = [
+    "2025-03-01",
+    "2025-02-30",
+    "2025-13-01",
+    "0000-01-01",
+    "1500-01-01",
+    # Partial dates must not be completed to the first day
+    "2025",
+    "2025-03",
+    # Timestamps and padded strings are rejected, as by date.fromisoformat
+    "2025-03-01T10:00:00",
+    "2025-03-01 10:00",
+    " 2025-03-01",
+    "2025-03-01 ",
+    # Other ISO layouts accepted by date.fromisoformat
+    "20250301",
+    "2025-W10-1",
+    "2025W101",
+    "01.03.2025",
+    "1.3.2025",
+    " 1.3.2025",
+    "31.02.2025",
+    "29.02.2024",
+    "01.03.1500",
+    "01.03.2025 ",
+    "vasket",
+    " Vasket ",
+    "garbage",
+    "",
+    None,
+]
+
+
+def test_normalize_dates_matches_scalar_parser():
+    expected = [harvester_hpr._normalize_date(value) for value in DATES]
+    assert harvester_hpr._normalize_dates(pd.Series(DATES, dtype=object)) == expected
+
+
+def test_normalize_dates_rejects_partial_and_padded_values():
+    values = ["2025", "2025-03", "2025-03-01T10:00:00", " 2025-03-01", "2025-03-01 ", "2025-03-01"]
+    assert harvester_hpr._normalize_dates(pd.Series(values, dtype=object)) == [None] * 5 + ["2025-03-01"]
+
+
+def test_normalize_dates_treats_missing_values_as_none():
+    values = pd.Series(["vasket", None, float("nan"), "01.03.2025"], dtype=object)
+    assert harvester_hpr._normalize_dates(values) == [None, None, None, "2025-03-01"]
+
+
+SAMPLE_HPR = os.path.join(os.path.dirname(__file__), "data", "sample.hpr")
+TABLES = ("stems", "logs", "stem_profile")
+
+
+def _import(tmp_path, **kwargs):
+    result = harvester_hpr.import_harvester_hpr(
+        hpr_path=SAMPLE_HPR, campaign_uid="C1", output_root=str(tmp_path), columnar=True, **kwargs
+    )
+    for name in TABLES:
+        result[name].pop("asset_uid", None)
+    return result
+
+
+def _same(a, b):
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b):
+        return True
+    return a == b or (a is None and isinstance(b, float) and math.isnan(b)) or (
+        b is None and isinstance(a, float) and math.isnan(a)
+    )
+
+
+def _assert_tables_equal(result, expected):
+    for name in TABLES:
+        assert set(result[name]) == set(expected[name])
+        for column, values in expected[name].items():
+            got = result[name][column]
+            assert len(got) == len(values), (name, column)
+            assert all(_same(a, b) for a, b in zip(got, values)), (name, column, got, values)
+
+
+def test_fast_parser_reads_sample(tmp_path):
+    result = _import(tmp_path, fast=True)
+    stems = result["stems"]
+    assert stems["stem_key"] == [1, 2, 3]
+    assert stems["harvest_date"] == ["2025-03-15", None, "2025-03-16"]
+    assert stems["dbh_cm"][0] == pytest.approx(31.2)
+    assert stems["computed_height_m"][0] == pytest.approx(21.5)
+    assert stems["computed_height_m"][2] == pytest.approx(18.2)
+    assert stems["volume_m3_sub"][0] == pytest.approx(0.31)
+    # A stem without logs has no volumes rather than zero volumes
+    assert stems["volume_m3_sub"][1] is None
+    assert stems["volume_m3_sob"][1] is None
+    assert stems["volume_m3_sob"][2] == pytest.approx(0.22)
+
+    logs = result["logs"]
+    assert logs["log_uid"] == ["C1_stem_1_log_1", "C1_stem_1_log_2", "C1_stem_3_log_1", "C1_stem_3_log_2"]
+    assert logs["start_pos_cm"] == [0.0, 430.0, 0.0, 490.0]
+    assert logs["butt_diameter_cm"][0] == pytest.approx(30.0)
+    assert logs["volume_m3"][3] is None
+
+    profile = result["stem_profile"]
+    assert profile["stem_uid"] == ["C1_stem_1", "C1_stem_1", "C1_stem_3"]
+    assert profile["profile_index"] == [1, 2, 1]
+    assert profile["stem_grade"] == [1, 3, None]
+
+
+def test_fast_parser_without_lxml(tmp_path, monkeypatch):
+    expected = _import(tmp_path / "lxml", fast=True)
+    monkeypatch.setattr(harvester_hpr, "etree", None)
+    _assert_tables_equal(_import(tmp_path / "stdlib", fast=True), expected)
+
+
+def test_fast_parser_keeps_the_rest_of_the_document():
+    document = harvester_hpr._fast_parse_hpr(SAMPLE_HPR)["document"]
+    names = [harvester_hpr._local_name(elem.tag) for elem in document.iter()]
+    assert "Stem" not in names
+    assert "ProductDefinition" in names
+    assert "ProductName" in names
+
+
+def test_fast_parser_matches_optbuck(tmp_path):
+    pytest.importorskip("optbuck")
+    expected = _import(tmp_path / "optbuck", fast=False)
+    _assert_tables_equal(_import(tmp_path / "fast", fast=True), expected)
+
+
+def test_single_pass_matches_optbuck(tmp_path):
+    pytest.importorskip("optbuck")
+    expected = _import(tmp_path / "optbuck", fast=False)
+    _assert_tables_equal(_import(tmp_path / "single", fast=False, single_pass=True), expected)
+
+
+def test_hpr_frames_derives_start_positions_and_stem_volumes():
+    stems, logs, profile = harvester_hpr._hpr_columns()
+    for key in (1, 2, 3):
+        stems.append({"StemKey": key})
+    nan = float("nan")
+    for stem_index, length, m3sub, m3sob in [
+        (0, 430.0, 0.2, 0.25),
+        (0, nan, 0.1, nan),
+        (0, 370.0, nan, nan),
+        (2, 490.0, nan, nan),
+        (2, 310.0, 0.15, nan),
+    ]:
+        logs.append({"StemIndex": stem_index, "LogLength": length, "m3sub": m3sub, "m3sob": m3sob})
+    stems_df, logs_df, _ = harvester_hpr._hpr_frames(stems, logs, profile)
+
+    # A missing log length counts as zero for the following logs
+    assert logs_df["StartPos"].tolist() == [0.0, 430.0, 430.0, 0.0, 490.0]
+    assert "StemIndex" not in logs_df
+    assert stems_df["m3sub"].tolist()[0] == pytest.approx(0.3)
+    assert stems_df["m3sob"].tolist()[0] == pytest.approx(0.25)
+    # Stems without logs or without any volume keep NaN instead of zero
+    assert stems_df["m3sub"].isna().tolist() == [False, True, False]
+    assert stems_df["m3sob"].isna().tolist() == [False, True, True]
@@ -0,0 +1,78 @@
+"""Tests for the LiDAR tree pack import."""
+
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+laspy = pytest.importorskip("laspy")
+
+from singletree.ingest.lidar import import_campaign_tree_packs  # noqa: E402
+
+
+def _write_tile(path, n, seed):
+    rng = np.random.default_rng(seed)
+    header = laspy.LasHeader(point_format=3, version="1.4")
+    header.scales = np.array([0.01, 0.01, 0.01])
+    header.offsets = np.zeros(3)
+    header.add_extra_dims(
+        [
+            laspy.ExtraBytesParams(name="instance_pred", type=np.int32),
+            laspy.ExtraBytesParams(name="semantic_pred", type=np.uint8),
+        ]
+    )
+    las = laspy.LasData(header)
+    las.x, las.y, las.z = rng.uniform(0, 100, (3, n))
+    las.instance_pred = rng.integers(-1, 5, n).astype(np.int32)
+    las.semantic_pred = rng.integers(0, 4, n).astype(np.uint8)
+    las.write(path)
+
+
+@pytest.fixture
+def tiles(tmp_path):
+    paths = []
+    for i, n in enumerate((500, 1200, 50)):
+        path = str(tmp_path / f"tile_{i}.laz")
+        _write_tile(path, n, seed=i)
+        paths.append(path)
+    return paths
+
+
+def _run(tiles, output_root, **kwargs):
+    records = import_campaign_tree_packs("C1", tiles, output_root=str(output_root), chunk_size=300, **kwargs)
+    clouds = {}
+    for record in records:
+        las = laspy.read(os.path.join(str(output_root), record["uri"]))
+        assert len(las.points) == record["point_count"]
+        clouds[record["asset_uid"]] = las.points.array
+    return records, clouds
+
+
+def test_splits_points_by_role(tiles, tmp_path):
+    records, clouds = _run(tiles, tmp_path / "out")
+    assert len(records) == 9
+    source = laspy.read(tiles[1])
+    tree = clouds["pc_C1_tile_1_tree_pack"]
+    ground = clouds["pc_C1_tile_1_ground_only"]
+    residual = clouds["pc_C1_tile_1_residual"]
+    assert ((tree["semantic_pred"] >= 2) & (tree["instance_pred"] > 0)).all()
+    assert (ground["semantic_pred"] == 1).all()
+    assert ((residual["semantic_pred"] >= 2) & (residual["instance_pred"] <= 0)).all()
+    assert len(tree) + len(residual) == np.count_nonzero(source.semantic_pred >= 2)
+    assert len(ground) == np.count_nonzero(source.semantic_pred == 1)
+
+
+def test_worker_processes_match_sequential_import(tiles, tmp_path):
+    expected_records, expected = _run(tiles, tmp_path / "sequential")
+    records, clouds = _run(tiles, tmp_path / "parallel", max_workers=2)
+    assert [r["asset_uid"] for r in records] == [r["asset_uid"] for r in expected_records]
+    for uid, array in expected.items():
+        assert clouds[uid].tobytes() == array.tobytes()
+
+
+@pytest.mark.parametrize("buffer_points", [1, 7, 250, 100_000])
+def test_buffered_outputs_match_direct_writes(tiles, tmp_path, buffer_points):
+    _, expected = _run(tiles, tmp_path / "direct")
+    _, clouds = _run(tiles, tmp_path / "buffered", buffer_points=buffer_points)
+    for uid, array in expected.items():
+        assert clouds[uid].tobytes() == array.tobytes()
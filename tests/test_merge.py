@@ -0,0 +1,84 @@
+"""Tests for merging campaign point clouds."""
+
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+laspy = pytest.importorskip("laspy")
+
+from singletree.pointcloud.merge import merge_campaign_tree_packs  # noqa: E402
+
+
+def _write_tile(path, xyz, *, point_format=3, scale=0.01, offset=0.0):
+    header = laspy.LasHeader(point_format=point_format, version="1.4")
+    header.scales = np.array([scale] * 3)
+    header.offsets = np.array([offset] * 3)
+    las = laspy.LasData(header)
+    las.x, las.y, las.z = xyz.T
+    las.write(path)
+
+
+def _tiles_dir(tmp_path):
+    tiles = tmp_path / "C1" / "tiles"
+    tiles.mkdir(parents=True)
+    return tiles
+
+
+def _merge(tmp_path, **kwargs):
+    return merge_campaign_tree_packs(
+        "C1", input_root=str(tmp_path), output_root=str(tmp_path), use_laszip=False, **kwargs
+    )
+
+
+@pytest.mark.parametrize("max_in_memory_points", [0, 1000])
+def test_merge_rejects_mismatched_point_formats(tmp_path, max_in_memory_points):
+    tiles = _tiles_dir(tmp_path)
+    xyz = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    _write_tile(str(tiles / "a_tree_pack.laz"), xyz, point_format=3)
+    _write_tile(str(tiles / "b_tree_pack.laz"), xyz, point_format=6)
+    with pytest.raises(laspy.LaspyException, match="Incompatible point formats"):
+        _merge(tmp_path, max_in_memory_points=max_in_memory_points)
+
+
+@pytest.mark.parametrize("max_in_memory_points", [0, 1000])
+def test_merge_rescales_tiles_to_the_first_header(tmp_path, max_in_memory_points):
+    tiles = _tiles_dir(tmp_path)
+    first = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    second = np.array([[100.5, 200.25, 10.0]])
+    _write_tile(str(tiles / "a_tree_pack.laz"), first)
+    _write_tile(str(tiles / "b_tree_pack.laz"), second, scale=0.001, offset=50.0)
+    (asset,) = _merge(tmp_path, max_in_memory_points=max_in_memory_points)
+    assert asset["point_count"] == 3
+    merged = laspy.read(os.path.join(str(tmp_path), asset["uri"]))
+    np.testing.assert_allclose(np.column_stack([merged.x, merged.y, merged.z]), np.vstack([first, second]))
+
+
+def test_merge_keeps_point_caches_out_of_the_tiles_directory(tmp_path):
+    tiles = _tiles_dir(tmp_path)
+    xyz = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    _write_tile(str(tiles / "a_tree_pack.laz"), xyz)
+    cache_dir = tmp_path / "cache"
+    (asset,) = _merge(tmp_path, use_cache=True, cache_dir=str(cache_dir))
+    assert sorted(os.listdir(str(tiles))) == ["a_tree_pack.laz"]
+    assert os.listdir(str(cache_dir)) == ["a_tree_pack.laz.npy"]
+    merged = laspy.read(os.path.join(str(tmp_path), asset["uri"]))
+    np.testing.assert_allclose(np.column_stack([merged.x, merged.y, merged.z]), xyz)
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_merge_from_caches_of_several_tiles_matches_direct_merge(tmp_path, max_workers):
+    tiles = _tiles_dir(tmp_path)
+    rng = np.random.default_rng(0)
+    for name, n in (("a", 40), ("b", 25), ("c", 60)):
+        _write_tile(str(tiles / f"{name}_tree_pack.laz"), rng.uniform(0, 100, (n, 3)))
+    (expected,) = _merge(tmp_path, out_filename="direct.laz")
+    cache_dir = tmp_path / "cache"
+    (asset,) = _merge(
+        tmp_path, out_filename="cached.laz", use_cache=True, cache_dir=str(cache_dir), max_workers=max_workers
+    )
+    assert sorted(os.listdir(str(cache_dir))) == [f"{name}_tree_pack.laz.npy" for name in "abc"]
+    assert asset["point_count"] == expected["point_count"] == 125
+    direct = laspy.read(os.path.join(str(tmp_path), expected["uri"]))
+    cached = laspy.read(os.path.join(str(tmp_path), asset["uri"]))
+    assert cached.points.array.tobytes() == direct.points.array.tobytes()
@@ -0,0 +1,30 @@
+"""Tests for the spatial query helpers."""
+
+import subprocess
+import sys
+
+import pytest
+
+from singletree import query
+
+
+def test_import_does_not_load_numpy_or_accelerators():
+    code = (
+        "import sys, singletree.query; "
+        "print(sorted({'numpy', 'numba', 'scipy'} & {m.split('.')[0] for m in sys.modules}))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "[]"
+
+
+def test_polygon_index_contains_matches_ray_casting():
+    np = pytest.importorskip("numpy")
+    polygon = [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (5.0, 4.0), (0.0, 10.0)]
+    rng = np.random.default_rng(0)
+    xs, ys = rng.uniform(-2, 12, (2, 2000))
+    expected = np.zeros(len(xs), dtype=bool)
+    for (x0, y0), (x1, y1) in zip(polygon, polygon[1:] + polygon[:1]):
+        if y0 != y1:
+            expected ^= ((y0 > ys) != (y1 > ys)) & (xs < (x1 - x0) * (ys - y0) / (y1 - y0) + x0)
+    inside = query.PolygonIndex(polygon).contains(xs, ys)
+    assert (inside == expected).all()